@@ -3,37 +3,71 @@ import sys
 import os
 import time
 import requests
-import subprocess
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import shutil
+import functools
 import pytz # Make sure pytz is installed: pip install pytz
 import json
 import shlex
 import traceback
-import html
 import re
+import collections
+import itertools
+import bisect
+import queue
 from pathlib import Path
-from datetime import datetime
-from typing import List, Dict, Optional, Tuple, Any
+from datetime import date, datetime, time as dt_time
+from typing import List, Dict, Optional, Tuple, Any, Iterator
+
+try:
+    import orjson # Optional, faster JSON parsing: pip install orjson
+    _loads = orjson.loads
+except ImportError:
+    _loads = json.loads
 
 # PyQt5 Imports
-from PyQt5.QtCore import Qt, QTimer, QProcess, QSize, QSettings
+from PyQt5.QtCore import (
+    Qt, QTimer, QProcess, QSize, QSettings, QSignalBlocker, QStandardPaths, QStringListModel, QObject, QFileSystemWatcher, QRunnable, QThread, QThreadPool, pyqtSignal
+)
 from PyQt5.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QGridLayout,
-    QLabel, QLineEdit, QPushButton, QTextEdit, QTabWidget, QComboBox, QCheckBox,
+    QLabel, QLineEdit, QPushButton, QTabWidget, QComboBox, QCheckBox,
     QSpinBox, QDoubleSpinBox, QMenuBar, QAction, QFileDialog, QMessageBox,
     QGroupBox, QScrollArea, QSizePolicy, QPlainTextEdit, QFrame, QActionGroup
 )
-from PyQt5.QtGui import QFont, QPalette, QColor
+from PyQt5.QtGui import QFont, QPalette, QColor, QSyntaxHighlighter, QTextCharFormat
 
 # --- Constants ---
 BASE_API_URL = "https://www.elprisetjustnu.se/api/v1/prices/{year}/{month_day}_{region}.json"
+# Price days follow Swedish time; the zone is looked up once
+STOCKHOLM_TZ = pytz.timezone("Europe/Stockholm")
+# Price control: a running miner is stopped only this far above the threshold, and the
+# price never starts or stops it again within MIN_DWELL_SECONDS of the last switch
+PRICE_HYSTERESIS_SEK = 0.02
+MIN_DWELL_SECONDS = 300
+# How long a stopped miner gets to exit after SIGTERM before it is killed
+MINER_KILL_GRACE_MS = 5000
+# ...and how long closing the window waits for all of them before killing the rest
+MINER_CLOSE_GRACE_MS = 1000
+# Lines kept in the log view; older lines are dropped as new ones arrive
+LOG_MAX_LINES = 5000
+# A miner's unterminated output is logged anyway once it grows past this
+MINER_PENDING_MAX_BYTES = 64 * 1024
 # Default executable names (can be changed via GUI)
 DEFAULT_GMINER_EXEC = "/home/anonymous/.local/bin/miner" # GMiner default name might vary
 DEFAULT_LOLMINER_EXEC = "/home/anonymous/.local/bin/lolMiner"
 DEFAULT_TREX_EXEC = "/home/anonymous/.local/bin/t-rex"
 DEFAULT_XMRIG_EXEC = "/home/anonymous/.local/bin/xmrig"
 DEFAULT_USER = "38bj4uu8uDsnC5NjoeGb8TMviBCEtMiaet" # Default NiceHash user
-
-NICEHASH_POOLS = [
+DEFAULT_EXECS = {
+    "gminer": DEFAULT_GMINER_EXEC,
+    "lolminer": DEFAULT_LOLMINER_EXEC,
+    "trex": DEFAULT_TREX_EXEC,
+    "xmrig": DEFAULT_XMRIG_EXEC,
+}
+
+NICEHASH_POOLS = (
     "(Egen / Custom...)", # Option to enable custom input
     "stratum+tcp://kawpow.auto.nicehash.com:9200",
     "stratum+tcp://alephium.auto.nicehash.com:9200",
@@ -65,59 +99,700 @@ NICEHASH_POOLS = [
     "stratum+tcp://xelishashv2.auto.nicehash.com:9200",
     "stratum+tcp://zelhash.auto.nicehash.com:9200",
     "stratum+tcp://zhash.auto.nicehash.com:9200",
+)
+_CUSTOM_POOL_SENTINEL = sys.intern(NICEHASH_POOLS[0])
+
+# Compiled once; strip_ansi_codes runs for every chunk of miner output.
+_ANSI_ESCAPE_RE = re.compile(r'\x1B(?:[@-Z\\-_]|\[[0-?]*[ -/]*[@-~])')
+_ANSI_ESCAPE_BYTES = re.compile(rb'\x1B(?:[@-Z\\-_]|\[[0-?]*[ -/]*[@-~])')
+
+# Base font applied by every theme stylesheet
+_BASE_STYLE = "font-size: 9pt;"
+_MONOSPACE_FONT = "Monospace"
+
+# One QSS skeleton shared by every theme; each theme only supplies its colours.
+# Text colours come from the theme's QPalette (see _theme_palette), so the sheet
+# only keeps what a palette cannot express: backgrounds, borders and sub-controls.
+# *_extra entries are optional declarations appended inside their rule; they may use {font}.
+_THEME_TEMPLATE = """
+    QWidget {{ {base} background-color: {bg}; border: 1px solid {border}; {widget_extra}}}
+    QMainWindow, QMenuBar, QMenu {{ background-color: {window_bg}; }}
+    QGroupBox {{ background-color: {group_bg}; {group_extra}border-radius: 4px; padding-top: 10px; margin-top: 5px; }}
+    QGroupBox::title {{ subcontrol-origin: margin; subcontrol-position: top center; padding: 0 5px; {title_extra}}}
+    QLineEdit, QPlainTextEdit, QSpinBox, QDoubleSpinBox, QComboBox {{ background-color: {input_bg}; border: 1px solid {input_border}; padding: 2px; }}
+    QPushButton {{ background-color: {button_bg}; border: {button_border}; padding: 5px; }}
+    QPushButton:hover {{ background-color: {button_hover}; {hover_extra}}}
+    QPushButton:pressed {{ background-color: {button_pressed}; }}
+    QPushButton:disabled {{ background-color: {disabled_bg}; }}
+    QTabWidget::pane {{ border: 1px solid {border}; }}
+    QTabBar::tab {{ background: {tab_bg}; padding: 6px; }}
+    QTabBar::tab:selected {{ background: {tab_selected}; }}
+"""
+# Only themes that define check_border style the checkbox indicator
+_CHECKBOX_TEMPLATE = """
+    QCheckBox::indicator {{ {check_extra}border: 1px solid {check_border}; }}
+    QCheckBox::indicator:checked {{ background-color: {check_on}; }}
+"""
+
+_THEME_PALETTES: Dict[str, Dict[str, str]] = {
+    "Mörkt": dict(
+        bg="#2b2b2b", fg="#f0f0f0", border="#3c3c3c", group_bg="#313131",
+        input_bg="#3c3c3c", input_fg="#f0f0f0", input_border="#555",
+        button_bg="#4d4d4d", button_fg="#f0f0f0", button_border="1px solid #555",
+        button_hover="#5a5a5a", button_pressed="#636363", disabled_bg="#404040", disabled_fg="#888",
+        tab_selected="#4d4d4d", check_border="#555", check_on="#5e81ac",
+        check_extra="width: 13px; height: 13px; ",
+    ),
+    "Ljust": dict(
+        bg="#ffffff", fg="#000000", border="#dcdcdc", window_bg="#f0f0f0", group_bg="#fafafa",
+        input_bg="#ffffff", input_fg="#000000", input_border="#cccccc",
+        button_bg="#e1e1e1", button_fg="#000000", button_border="1px solid #cccccc",
+        button_hover="#d1d1d1", button_pressed="#c1c1c1", disabled_bg="#f5f5f5", disabled_fg="#aaaaaa",
+        tab_bg="#f0f0f0", tab_selected="#ffffff",
+    ),
+    "Nord": dict(
+        bg="#2E3440", fg="#D8DEE9", border="#4C566A", group_bg="#3B4252", title_extra="color: #E5E9F0; ",
+        input_bg="#434C5E", input_fg="#ECEFF4", input_border="#4C566A",
+        button_bg="#5E81AC", button_fg="#ECEFF4", button_border="none",
+        button_hover="#81A1C1", button_pressed="#88C0D0", disabled_bg="#4C566A", disabled_fg="#D8DEE9",
+        tab_selected="#434C5E", check_border="#4C566A", check_on="#88C0D0",
+    ),
+    "Matrix": dict(
+        bg="#000000", fg="#00FF00", border="#00FF00", widget_extra="font-family: {font}; ",
+        group_bg="#0A0A0A", group_extra="border: 1px solid #00FF00; ",
+        input_bg="#050505", input_fg="#39FF14", input_border="#00FF00",
+        button_bg="#080808", button_fg="#00FF00", button_border="1px solid #00FF00",
+        button_hover="#111", hover_extra="color: #39FF14; ", button_pressed="#222",
+        disabled_bg="#050505", disabled_fg="#008F00", tab_selected="#1A1A1A",
+    ),
+    "Synthwave": dict(
+        bg="#262335", fg="#FFD4E9", border="#73479A", window_bg="#1D1A2A", group_bg="#352F4E", title_extra="color: #F92A82; ",
+        input_bg="#1D1A2A", input_fg="#FFF", input_border="#73479A",
+        button_bg="#F92A82", button_fg="#FFF", button_border="none",
+        button_hover="#FF57AC", button_pressed="#C72267", disabled_bg="#73479A", disabled_fg="#B392C9",
+        tab_selected="#352F4E", check_border="#73479A", check_on="#00FFFF",
+    ),
+    "Dracula": dict(
+        bg="#282a36", fg="#f8f8f2", border="#44475a", group_bg="#333644", title_extra="color: #bd93f9; ",
+        input_bg="#44475a", input_fg="#f8f8f2", input_border="#6272a4",
+        button_bg="#6272a4", button_fg="#f8f8f2", button_border="none",
+        button_hover="#7284b8", button_pressed="#526294", disabled_bg="#3b3d4a", disabled_fg="#6272a4",
+        tab_selected="#44475a", check_border="#6272a4", check_on="#ff79c6",
+    ),
+}
+
+def _render_theme(palette: Dict[str, str], font: str) -> str:
+    values = dict(base=_BASE_STYLE, widget_extra="", group_extra="", title_extra="", hover_extra="", check_extra="")
+    values.update(window_bg=palette["bg"], tab_bg=palette["bg"])
+    values.update(palette)
+    for name in ("widget_extra", "group_extra", "title_extra", "hover_extra", "check_extra"):
+        values[name] = values[name].format(font=font)
+    sheet = _THEME_TEMPLATE.format(**values)
+    if "check_border" in values:
+        sheet += _CHECKBOX_TEMPLATE.format(**values)
+    return sheet
+
+# Miner output color for themes where the default dark blue is unreadable
+_MINER_LOG_COLORS = {"Dracula": "#8be9fd", "Synthwave": "#00FFFF"}
+
+# "Standard" means Qt's own style and has no sheet
+_THEME_NAMES = ("Standard", *_THEME_PALETTES)
+# Rendered stylesheets per (theme, monospace font), filled on first use
+_THEME_CACHE: Dict[Tuple[str, str], str] = {}
+
+def _theme_sheet(name: str, font: str = _MONOSPACE_FONT) -> str:
+    key = (name, font)
+    sheet = _THEME_CACHE.get(key)
+    if sheet is None:
+        palette = _THEME_PALETTES.get(name)
+        sheet = _THEME_CACHE[key] = _render_theme(palette, font) if palette else ""
+    return sheet
+
+# Palette role -> theme colour; the sheet above no longer sets these
+_PALETTE_ROLES = (
+    (QPalette.ColorRole.Window, "bg"), (QPalette.ColorRole.WindowText, "fg"),
+    (QPalette.ColorRole.Base, "input_bg"), (QPalette.ColorRole.Text, "input_fg"),
+    (QPalette.ColorRole.Button, "button_bg"), (QPalette.ColorRole.ButtonText, "button_fg"),
+)
+_PALETTE_CACHE: Dict[str, QPalette] = {}
+
+def _theme_palette(name: str) -> QPalette:
+    """Qt's standard palette with the theme's text and fill colours; Standard/unknown get it unchanged."""
+    palette = _PALETTE_CACHE.get(name)
+    if palette is None:
+        palette = QApplication.style().standardPalette()
+        colours = _THEME_PALETTES.get(name)
+        if colours:
+            for role, key in _PALETTE_ROLES:
+                palette.setColor(role, QColor(colours[key]))
+            palette.setColor(QPalette.ColorGroup.Disabled, QPalette.ColorRole.ButtonText, QColor(colours["disabled_fg"]))
+        _PALETTE_CACHE[name] = palette
+    return palette
+
+# --- Tab Layouts ---
+# Each tab is a list of groups; a group is a title plus rows of fields. A
+# field's label goes in its column and the widget right after it (checkboxes
+# carry their own text). "browse" adds a file-picker button after the widget.
+def _field(kind: str, attr: str, label: str, key: str = "", default: Any = "", col: int = 0, span: int = 1, **extra) -> Dict[str, Any]:
+    return dict(kind=kind, attr=attr, label=label, key=key, default=default, col=col, span=span, **extra)
+
+def _path_group(prefix: str, label: str, default: str, title: str):
+    return ("Sökväg", [
+        [_field("edit", f"{prefix}_path_edit", label, "path", default, browse=title)],
+    ])
+
+_OFF_ON = ["off", "on"]
+
+GMINER_TAB_SPEC = [
+    _path_group("gminer", "GMiner Program:", DEFAULT_GMINER_EXEC, "Välj GMiner"),
+    ("Nätverk", [
+        [_field("combo", "gminer_algo_combo", "Algorithm (-a):", "algo", "kawpow", span=2,
+                items=["ethash", "etchash", "kawpow", "autolykos2", "beamhash", "cuckatoo32", "kheavyhash", "sha512_256d", "ironfish", "octopus", "karlsenhash", "zil", "ethash+kheavyhash", "etchash+kheavyhash"])],
+        [_field("pool", "", "Pool (-s):", span=3)],
+        [_field("edit", "gminer_user_edit", "User (-u):", "user", DEFAULT_USER, span=2)],
+        [_field("edit", "gminer_pass_edit", "Password (-p):", "pass", "x", span=2)],
+        [_field("combo", "gminer_ssl_combo", "--ssl (on/off):", "ssl", "off", items=_OFF_ON)],
+        [_field("combo", "gminer_proto_combo", "--proto:", "proto", "stratum", items=["stratum", "proxy"])],
+        [_field("edit", "gminer_proxy_edit", "--proxy (socks5):", "proxy", span=2)],
+    ]),
+    ("GPU", [
+        [_field("edit", "gminer_devices_edit", "-d, --devices:", "devices", span=2)],
+        [_field("edit", "gminer_intensity_edit", "-i, --intensity:", "intensity", span=2)],
+        [_field("edit", "gminer_dual_intensity_edit", "-di, --dual_intensity:", "dual_intensity", span=2)],
+        [_field("edit", "gminer_fan_edit", "--fan:", "fan", span=2)],
+        [_field("edit", "gminer_pl_edit", "--pl (Power Limit %/W):", "pl", span=2)],
+    ]),
+    ("Överklockning", [
+        [_field("edit", "gminer_cclock_edit", "--cclock:", "cclock", span=2)],
+        [_field("edit", "gminer_mclock_edit", "--mclock:", "mclock", span=2)],
+        [_field("edit", "gminer_lock_cclock_edit", "--lock_cclock:", "lock_cclock", span=2)],
+        [_field("edit", "gminer_lock_mclock_edit", "--lock_mclock:", "lock_mclock", span=2)],
+        [_field("edit", "gminer_mt_edit", "--mt (Mem Tweak 0-6):", "mt", span=2)],
+    ]),
+    ("Loggning & Diverse", [
+        [_field("edit", "gminer_logfile_edit", "-l, --logfile:", "logfile", browse="Välj loggfil")],
+        [_field("spin", "gminer_log_date_spin", "--log_date (0/1):", "log_date", 0, range=(0, 1))],
+        [_field("spin", "gminer_log_newjob_spin", "--log_newjob (0/1):", "log_newjob", 1, range=(0, 1))],
+        [_field("edit", "gminer_api_edit", "--api (port):", "api")],
+        [_field("edit", "gminer_config_edit", "--config:", "config", browse="Välj configfil")],
+        [_field("check", "gminer_color_cb", "-c, --color (Enable)", "color", False),
+         _field("check", "gminer_watchdog_cb", "-w, --watchdog (Enable)", "watchdog", True, col=1)],
+    ]),
 ]
 
+LOLMINER_TAB_SPEC = [
+    _path_group("lolminer", "lolMiner Program:", DEFAULT_LOLMINER_EXEC, "Välj lolMiner"),
+    ("General & Mining", [
+        [_field("edit", "lolminer_algo_edit", "--algo (-a):", "algo", "ETCHASH", span=2)],
+        [_field("pool", "", "Pool (-p):", span=3)],
+        [_field("edit", "lolminer_user_edit", "--user (-u):", "user", DEFAULT_USER, span=2)],
+        [_field("edit", "lolminer_pass_edit", "--pass:", "pass", "x", span=2)],
+        [_field("edit", "lolminer_devices_edit", "--devices:", "devices", "ALL", span=2)],
+        [_field("combo", "lolminer_tls_combo", "--tls (on/off):", "tls", "off", items=_OFF_ON)],
+        [_field("edit", "lolminer_socks5_edit", "--socks5:", "socks5", span=2)],
+        [_field("spin", "lolminer_doh_spin", "--dns-over-https (0/1/2):", "doh", 1, range=(0, 2)),
+         _field("edit", "lolminer_benchmark_edit", "--benchmark:", "benchmark", col=2, tooltip="Ex: KAWPOW")],
+        [_field("check", "lolminer_devicesbypcie_cb", "--devicesbypcie", "devicesbypcie", False),
+         _field("check", "lolminer_nocolor_cb", "--nocolor", "nocolor", False, col=1),
+         _field("check", "lolminer_basecolor_cb", "--basecolor", "basecolor", False, col=2)],
+        [_field("edit", "lolminer_config_edit", "--config:", "config", "./lolMiner.cfg", browse="Välj lolMiner Config")],
+        [_field("edit", "lolminer_json_edit", "--json:", "json", "./user_config.json", browse="Välj lolMiner JSON")],
+        [_field("edit", "lolminer_profile_edit", "--profile:", "profile", span=2)],
+        [_field("check", "lolminer_no_cl_cb", "--no-cl", "no-cl", False),
+         _field("check", "lolminer_version_cb", "-v (version)", "version", False, col=1)],
+    ]),
+    ("Managing & Stats", [
+        [_field("combo", "lolminer_watchdog_combo", "--watchdog:", "watchdog", "script", items=["script", "exit", "off"]),
+         _field("edit", "lolminer_watchdogscript_edit", "--watchdogscript:", "watchdogscript", col=2)],
+        [_field("spin", "lolminer_tstart_spin", "--tstart:", "tstart", 0, range=(0, 120)),
+         _field("spin", "lolminer_tstop_spin", "--tstop:", "tstop", 0, col=2, range=(0, 120))],
+        [_field("combo", "lolminer_tmode_combo", "--tmode:", "tmode", "edge", items=["edge", "junction", "memory"])],
+        [_field("spin", "lolminer_apiport_spin", "--apiport:", "apiport", 0, range=(0, 65535)),
+         _field("edit", "lolminer_apihost_edit", "--apihost:", "apihost", "0.0.0.0", col=2)],
+        [_field("spin", "lolminer_longstats_spin", "--longstats:", "longstats", 60, range=(1, 9999)),
+         _field("spin", "lolminer_shortstats_spin", "--shortstats:", "shortstats", 15, col=2, range=(1, 9999))],
+        [_field("check", "lolminer_timeprint_cb", "--timeprint", "timeprint", False),
+         _field("check", "lolminer_compactaccept_cb", "--compactaccept", "compactaccept", False, col=1)],
+        [_field("check", "lolminer_log_cb", "--log", "log", False),
+         _field("edit", "lolminer_logfile_edit", "--logfile:", "logfile", col=1, browse="Välj lolMiner loggfil")],
+    ]),
+    ("Överklockning (Experimentell)", [
+        [_field("edit", "lolminer_cclk_edit", "--cclk:", "cclk", "*"),
+         _field("edit", "lolminer_mclk_edit", "--mclk:", "mclk", "*", col=2)],
+        [_field("edit", "lolminer_coff_edit", "--coff:", "coff", "*"),
+         _field("edit", "lolminer_moff_edit", "--moff:", "moff", "*", col=2)],
+        [_field("edit", "lolminer_fan_edit", "--fan:", "fan", "*"),
+         _field("edit", "lolminer_pl_edit", "--pl:", "pl", "*", col=2)],
+        [_field("check", "lolminer_no_oc_reset_cb", "--no-oc-reset", "no-oc-reset", False)],
+    ]),
+    ("Ethash/Altcoin/Dual", [
+        [_field("combo", "lolminer_ethstratum_combo", "--ethstratum:", "ethstratum", "ETHV1", items=["ETHV1", "ETHPROXY"]),
+         _field("edit", "lolminer_worker_eth_edit", "--worker (Eth):", "worker_eth", "eth1.0", col=2)],
+        [_field("edit", "lolminer_lhrtune_edit", "--lhrtune:", "lhrtune", "auto")],
+        [_field("combo", "lolminer_dualmode_combo", "--dualmode:", "dualmode", "none", items=["none", "zil", "zilEx", "eth", "etc"]),
+         _field("edit", "lolminer_dualpool_edit", "--dualpool:", "dualpool", col=2)],
+        [_field("edit", "lolminer_dualuser_edit", "--dualuser:", "dualuser"),
+         _field("edit", "lolminer_dualpass_edit", "--dualpass:", "dualpass", col=2)],
+    ]),
+]
+
+TREX_TAB_SPEC = [
+    _path_group("trex", "T-Rex Program:", DEFAULT_TREX_EXEC, "Välj T-Rex"),
+    ("Nätverk", [
+        [_field("combo", "trex_algo_combo", "Algorithm (-a):", "algo", "kawpow", span=2,
+                items=["autolykos2", "blake3", "etchash", "ethash", "firopow", "kawpow", "mtp", "mtp-tcr", "multi", "octopus", "progpow", "progpow-veil", "progpow-veriblock", "progpowz", "tensority"])],
+        [_field("edit", "trex_coin_edit", "--coin:", "coin", span=2)],
+        [_field("pool", "", "URL (-o):", span=3)],
+        [_field("edit", "trex_user_edit", "User (-u):", "user", DEFAULT_USER, span=2)],
+        [_field("edit", "trex_pass_edit", "Password (-p):", "pass", "x", span=2)],
+        [_field("edit", "trex_worker_edit", "--worker (-w):", "worker", "rig0", span=2)],
+        [_field("edit", "trex_url2_edit", "--url2:", "url2", span=2)],
+        [_field("edit", "trex_user2_edit", "--user2:", "user2", span=2)],
+        [_field("edit", "trex_pass2_edit", "--pass2:", "pass2", span=2)],
+        [_field("edit", "trex_worker2_edit", "--worker2:", "worker2", span=2)],
+    ]),
+    ("GPU & Överklockning", [
+        [_field("edit", "trex_devices_edit", "--devices (-d):", "devices"),
+         _field("edit", "trex_intensity_edit", "--intensity (-i):", "intensity", col=2)],
+        [_field("edit", "trex_pl_edit", "--pl:", "pl"),
+         _field("edit", "trex_fan_edit", "--fan:", "fan", col=2)],
+        [_field("edit", "trex_lock_cclock_edit", "--lock-cclock:", "lock-cclock"),
+         _field("edit", "trex_cclock_edit", "--cclock:", "cclock", col=2)],
+        [_field("edit", "trex_lock_cv_edit", "--lock-cv:", "lock-cv"),
+         _field("edit", "trex_mclock_edit", "--mclock:", "mclock", col=2)],
+        [_field("edit", "trex_mt_edit", "--mt:", "mt"),
+         _field("check", "trex_low_load_cb", "--low-load", "low-load", False, col=2)],
+    ]),
+    ("LHR", [
+        [_field("edit", "trex_lhr_tune_edit", "--lhr-tune:", "lhr-tune", "-1"),
+         _field("combo", "trex_lhr_autotune_combo", "--lhr-autotune-mode:", "lhr-autotune-mode", "down", col=2, items=["off", "down", "full"])],
+    ]),
+    ("Diverse", [
+        [_field("edit", "trex_api_bind_edit", "--api-bind-http:", "api-bind-http", "127.0.0.1:4067"),
+         _field("check", "trex_api_https_cb", "--api-https", "api-https", False, col=2)],
+        [_field("edit", "trex_api_key_edit", "--api-key:", "api-key"),
+         _field("check", "trex_api_read_only_cb", "--api-read-only", "api-read-only", False, col=2)],
+        [_field("check", "trex_no_watchdog_cb", "--no-watchdog", "no-watchdog", False),
+         _field("check", "trex_protocol_dump_cb", "-P, --protocol-dump", "protocol-dump", False, col=1)],
+        [_field("edit", "trex_log_path_edit", "--log-path (-l):", "log-path"),
+         _field("check", "trex_quiet_cb", "--quiet (-q)", "quiet", False, col=2)],
+        [_field("edit", "trex_watchdog_exit_edit", "--watchdog-exit-mode:", "watchdog-exit-mode", span=2, tooltip="Ex: r:10,s:600")],
+        [_field("edit", "trex_config_edit", "-c, --config:", "config", browse="Välj T-Rex Config")],
+        [_field("check", "trex_benchmark_cb", "-B, --benchmark", "benchmark", False),
+         _field("check", "trex_no_color_cb", "--no-color", "no-color", False, col=1)],
+    ]),
+]
+
+# XMRig puts its options on sub-tabs: a group with a None title holds (page title, rows) pairs
+XMRIG_TAB_SPEC = [
+    _path_group("xmrig", "XMRig Program:", DEFAULT_XMRIG_EXEC, "Välj XMRig"),
+    (None, [
+        ("Network", [
+            [_field("pool", "", "URL (-o):", span=3)],
+            [_field("edit", "xmrig_algo_edit", "Algo (-a):", "algo", "randomx"),
+             _field("edit", "xmrig_coin_edit", "--coin:", "coin", col=2)],
+            [_field("edit", "xmrig_user_edit", "User (-u):", "user", DEFAULT_USER, span=3)],
+            [_field("edit", "xmrig_pass_edit", "Password (-p):", "pass", "x"),
+             _field("edit", "xmrig_userpass_edit", "User:Pass (-O):", "userpass", col=2)],
+            [_field("edit", "xmrig_proxy_edit", "Proxy (-x):", "proxy"),
+             _field("edit", "xmrig_rigid_edit", "--rig-id:", "rig-id", col=2)],
+            [_field("check", "xmrig_keepalive_cb", "-k", "keepalive", False),
+             _field("check", "xmrig_nicehash_cb", "--nicehash", "nicehash", False, col=1),
+             _field("check", "xmrig_tls_cb", "--tls", "tls", False, col=2)],
+            [_field("edit", "xmrig_tls_fp_edit", "--tls-fingerprint:", "tls-fingerprint", span=3)],
+            [_field("check", "xmrig_daemon_cb", "--daemon", "daemon", False),
+             _field("check", "xmrig_dns_ipv6_cb", "--dns-ipv6", "dns-ipv6", False, col=1)],
+        ]),
+        ("CPU", [
+            [_field("check", "xmrig_no_cpu_cb", "--no-cpu", "no-cpu", False, span=2)],
+            [_field("edit", "xmrig_threads_edit", "Threads (-t):", "threads"),
+             _field("edit", "xmrig_cpu_affinity_edit", "--cpu-affinity:", "cpu-affinity", col=2)],
+            [_field("spin", "xmrig_av_spin", "Algo Var (-v):", "av", 0, range=(0, 99)),
+             _field("spin", "xmrig_cpu_priority_spin", "--cpu-priority:", "cpu-priority", 2, col=2, range=(0, 5))],
+            [_field("check", "xmrig_no_huge_pages_cb", "--no-huge-pages", "no-huge-pages", False),
+             _field("check", "xmrig_randomx_no_numa_cb", "--randomx-no-numa", "randomx-no-numa", False, col=1)],
+        ]),
+        ("API/Log/Misc", [
+            [_field("spin", "xmrig_http_port_spin", "--http-port:", "http-port", 0, range=(0, 65535)),
+             _field("edit", "xmrig_http_access_token_edit", "--http-access-token:", "http-access-token", col=2)],
+            [_field("edit", "xmrig_log_file_edit", "--log-file (-l):", "log-file", browse="Välj loggfil")],
+            [_field("check", "xmrig_verbose_cb", "--verbose", "verbose", False),
+             _field("check", "xmrig_background_cb", "-B", "background", False, col=1)],
+            [_field("edit", "xmrig_config_file_edit", "-c, --config:", "config", browse="Välj XMRig Config")],
+        ]),
+    ]),
+]
+
+# --- Command-line Flags ---
+# Per miner, the options that map one widget to one flag, in argv order. Each
+# emitter turns a widget value into the argv items to append (or none).
+def _opt(flag: str):
+    """flag value, when the value is non-empty."""
+    return lambda value: (flag, value) if value else ()
+
+def _opt_unless(flag: str, *defaults: Any):
+    """flag value, when the value is none of the miner's own defaults."""
+    return lambda value: (flag, str(value)) if value not in defaults else ()
+
+def _opt_unless_nocase(flag: str, default: str):
+    """flag value, when the text differs from default ignoring case."""
+    default = default.casefold()
+    return lambda value: (flag, value) if value.casefold() != default else ()
+
+def _switch(flag: str):
+    """flag alone, when the checkbox is ticked."""
+    emitted = (flag,)
+    return lambda value: emitted if value else ()
+
+def _stripped(emit):
+    """Feeds emit the text with surrounding whitespace removed."""
+    return lambda value: emit(value.strip())
+
+def _opt_when(flag: str, expected: Any, literal: str):
+    """flag literal, when the value equals expected."""
+    emitted = (flag, literal)
+    return lambda value: emitted if value == expected else ()
+
+GMINER_CLI_FLAGS = (
+    ("gminer_algo_combo", _opt("-a")),
+    ("gminer_user_edit", _opt("-u")),
+    ("gminer_pass_edit", _opt("-p")),
+    ("gminer_ssl_combo", _opt_when("--ssl", "on", "1")),
+    ("gminer_proto_combo", _opt_unless("--proto", "stratum")),
+    ("gminer_proxy_edit", _opt("--proxy")),
+    ("gminer_devices_edit", _opt("-d")),
+    ("gminer_intensity_edit", _opt("-i")),
+    ("gminer_dual_intensity_edit", _opt("-di")),
+    ("gminer_fan_edit", _opt("--fan")),
+    ("gminer_pl_edit", _opt("--pl")),
+    ("gminer_cclock_edit", _opt("--cclock")),
+    ("gminer_mclock_edit", _opt("--mclock")),
+    ("gminer_lock_cclock_edit", _opt("--lock_cclock")),
+    ("gminer_lock_mclock_edit", _opt("--lock_mclock")),
+    ("gminer_mt_edit", _opt("--mt")),
+    ("gminer_logfile_edit", _opt("-l")),
+    ("gminer_log_date_spin", _opt_when("--log_date", 1, "1")),
+    ("gminer_log_newjob_spin", _opt_when("--log_newjob", 0, "0")),
+    ("gminer_api_edit", _opt("--api")),
+    ("gminer_color_cb", _opt_when("-c", False, "0")),
+    ("gminer_watchdog_cb", _opt_when("-w", False, "0")),
+)
+
+# Everything after --benchmark; the profile/pool head and the --dualmode block stay in the builder
+LOLMINER_CLI_FLAGS = (
+    ("lolminer_tls_combo", _opt_when("--tls", "on", "on")),
+    ("lolminer_devices_edit", _stripped(_opt_unless_nocase("--devices", "ALL"))),
+    ("lolminer_devicesbypcie_cb", _switch("--devicesbypcie")),
+    ("lolminer_socks5_edit", _stripped(_opt("--socks5"))),
+    ("lolminer_doh_spin", _opt_unless("--dns-over-https", 1)),
+    ("lolminer_watchdog_combo", _opt_unless("--watchdog", "script")),
+    ("lolminer_watchdogscript_edit", _stripped(_opt("--watchdogscript"))),
+    ("lolminer_tstart_spin", _opt_unless("--tstart", 0)),
+    ("lolminer_tstop_spin", _opt_unless("--tstop", 0)),
+    ("lolminer_tmode_combo", _opt_unless("--tmode", "edge")),
+    ("lolminer_apiport_spin", _opt_unless("--apiport", 0)),
+    ("lolminer_apihost_edit", _stripped(_opt_unless("--apihost", "0.0.0.0"))),
+    ("lolminer_longstats_spin", _opt_unless("--longstats", 60)),
+    ("lolminer_shortstats_spin", _opt_unless("--shortstats", 15)),
+    ("lolminer_timeprint_cb", _switch("--timeprint")),
+    ("lolminer_compactaccept_cb", _switch("--compactaccept")),
+    ("lolminer_log_cb", _switch("--log")),
+    ("lolminer_logfile_edit", _stripped(_opt("--logfile"))),
+    # "*" leaves the card's own clock/fan/power setting alone
+    ("lolminer_cclk_edit", _stripped(_opt_unless("--cclk", "", "*"))),
+    ("lolminer_mclk_edit", _stripped(_opt_unless("--mclk", "", "*"))),
+    ("lolminer_coff_edit", _stripped(_opt_unless("--coff", "", "*"))),
+    ("lolminer_moff_edit", _stripped(_opt_unless("--moff", "", "*"))),
+    ("lolminer_fan_edit", _stripped(_opt_unless("--fan", "", "*"))),
+    ("lolminer_pl_edit", _stripped(_opt_unless("--pl", "", "*"))),
+    ("lolminer_no_oc_reset_cb", _switch("--no-oc-reset")),
+    ("lolminer_ethstratum_combo", _opt_unless("--ethstratum", "ETHPROXY")),
+    ("lolminer_lhrtune_edit", _stripped(_opt_unless_nocase("--lhrtune", "auto"))),
+)
+
+# Everything after -o; config and benchmark runs return early in the builder
+TREX_CLI_FLAGS = (
+    ("trex_algo_combo", _opt("-a")),
+    ("trex_coin_edit", _opt("--coin")),
+    ("trex_user_edit", _opt("-u")),
+    ("trex_pass_edit", _opt("-p")),
+    ("trex_worker_edit", _opt("-w")),
+    ("trex_url2_edit", _opt("--url2")),
+    ("trex_user2_edit", _opt("--user2")),
+    ("trex_pass2_edit", _opt("--pass2")),
+    ("trex_worker2_edit", _opt("--worker2")),
+    ("trex_devices_edit", _opt("-d")),
+    ("trex_intensity_edit", _opt("-i")),
+    ("trex_low_load_cb", _switch("--low-load")),
+    ("trex_fan_edit", _opt("--fan")),
+    ("trex_pl_edit", _opt("--pl")),
+    ("trex_cclock_edit", _opt("--cclock")),
+    ("trex_lock_cclock_edit", _opt("--lock-cclock")),
+    ("trex_mclock_edit", _opt("--mclock")),
+    ("trex_lock_cv_edit", _opt("--lock-cv")),
+    ("trex_mt_edit", _opt("--mt")),
+    ("trex_lhr_tune_edit", _opt_unless("--lhr-tune", "-1")),
+    ("trex_lhr_autotune_combo", _opt_unless("--lhr-autotune-mode", "down")),
+    ("trex_api_bind_edit", _opt_unless("--api-bind-http", "127.0.0.1:4067")),
+    ("trex_api_https_cb", _switch("--api-https")),
+    ("trex_api_key_edit", _opt("--api-key")),
+    ("trex_api_read_only_cb", _switch("--api-read-only")),
+    ("trex_quiet_cb", _switch("-q")),
+    ("trex_no_color_cb", _switch("--no-color")),
+    ("trex_log_path_edit", _opt("-l")),
+    ("trex_protocol_dump_cb", _switch("-P")),
+    ("trex_no_watchdog_cb", _switch("--no-watchdog")),
+    ("trex_watchdog_exit_edit", _opt("--watchdog-exit-mode")),
+)
+
+# Everything after -o. A third element names a widget that, when set, drops the flag:
+# -O replaces -u/-p, and --no-cpu makes the CPU options moot
+XMRIG_CLI_FLAGS = (
+    ("xmrig_algo_edit", _opt("-a")),
+    ("xmrig_coin_edit", _opt("--coin")),
+    ("xmrig_userpass_edit", _opt("-O")),
+    ("xmrig_user_edit", _opt("-u"), "xmrig_userpass_edit"),
+    ("xmrig_pass_edit", _opt("-p"), "xmrig_userpass_edit"),
+    ("xmrig_proxy_edit", _opt("-x")),
+    ("xmrig_keepalive_cb", _switch("-k")),
+    ("xmrig_nicehash_cb", _switch("--nicehash")),
+    ("xmrig_rigid_edit", _opt("--rig-id")),
+    ("xmrig_tls_cb", _switch("--tls")),
+    ("xmrig_tls_fp_edit", _opt("--tls-fingerprint")),
+    ("xmrig_daemon_cb", _switch("--daemon")),
+    ("xmrig_dns_ipv6_cb", _switch("--dns-ipv6")),
+    ("xmrig_no_cpu_cb", _switch("--no-cpu")),
+    ("xmrig_threads_edit", _opt("-t"), "xmrig_no_cpu_cb"),
+    ("xmrig_cpu_affinity_edit", _opt("--cpu-affinity"), "xmrig_no_cpu_cb"),
+    ("xmrig_av_spin", _opt_unless("-v", 0), "xmrig_no_cpu_cb"),
+    ("xmrig_cpu_priority_spin", _opt_unless("--cpu-priority", 2), "xmrig_no_cpu_cb"),
+    ("xmrig_no_huge_pages_cb", _switch("--no-huge-pages"), "xmrig_no_cpu_cb"),
+    ("xmrig_randomx_no_numa_cb", _switch("--randomx-no-numa"), "xmrig_no_cpu_cb"),
+    ("xmrig_http_port_spin", _opt_unless("--http-port", 0)),
+    ("xmrig_http_access_token_edit", _opt("--http-access-token")),
+    ("xmrig_log_file_edit", _opt("-l")),
+    ("xmrig_verbose_cb", _switch("--verbose")),
+    ("xmrig_background_cb", _switch("-B")),
+)
+
+_CLI_FLAGS = {"gminer": GMINER_CLI_FLAGS, "lolminer": LOLMINER_CLI_FLAGS, "trex": TREX_CLI_FLAGS, "xmrig": XMRIG_CLI_FLAGS}
 
 # --- Helper Functions ---
 def strip_ansi_codes(text: str) -> str:
     """Removes ANSI escape codes from a string."""
-    ansi_escape = re.compile(r'\x1B(?:[@-Z\\-_]|\[[0-?]*[ -/]*[@-~])')
-    return ansi_escape.sub('', text)
+    if '\x1b' not in text:
+        return text
+    return _ANSI_ESCAPE_RE.sub('', text)
 
 def check_executable(name: str) -> bool:
     """Checks if an executable exists in the system PATH or is an absolute path."""
-    if not name:
-        return False
-    p = Path(name)
-    if p.is_absolute():
-        try:
-            return p.is_file() and os.access(p, os.X_OK)
-        except OSError:
-            return False
+    return resolve_executable(name) is not None
 
+def resolve_executable(name: str) -> Optional[str]:
+    """The file check_executable accepts for name, or None."""
+    if not name:
+        return None
+    resolved = name if Path(name).is_absolute() else shutil.which(name)
+    if not resolved:
+        return None
     try:
-        result = subprocess.run([name, "--version"], capture_output=True, text=True, check=False, timeout=5)
-        return result.returncode in [0, 1, 255] or name.lower() in result.stdout.lower() or name.lower() in result.stderr.lower()
-    except FileNotFoundError:
-        return False
-    except subprocess.TimeoutExpired:
-         print(f"Timeout checking executable: {name}")
-         return False
-    except Exception as e:
-        print(f"Error checking executable {name}: {e}")
-        return False
-
-def create_browse_button(line_edit: QLineEdit, parent: QWidget, title: str = "Välj fil"):
-    """Helper to create a browse button linked to a QLineEdit."""
-    button = QPushButton("...")
-    button.setFixedWidth(30)
-    def browse():
-        start_dir = str(Path.home())
-        if line_edit.text():
-            p = Path(line_edit.text())
-            try:
-                if p.exists():
-                     start_dir = str(p.parent if p.is_file() else p)
-                elif p.parent.exists():
-                     start_dir = str(p.parent)
-            except Exception:
-                 pass
+        mtime = os.stat(resolved).st_mtime_ns
+    except OSError:
+        return None
+    return resolved if _is_executable_file(resolved, mtime) else None
+
+@functools.lru_cache(maxsize=64)
+def _is_executable_file(path: str, mtime: int) -> bool:
+    """Cached X_OK test; mtime is part of the key so a replaced binary is re-checked."""
+    return os.path.isfile(path) and os.access(path, os.X_OK)
+
+@functools.lru_cache(maxsize=8)
+def _api_url(day: date, region: str) -> str:
+    """Price URL for one day and region; the next day simply becomes a new entry."""
+    return BASE_API_URL.format(year=day.year, month_day=day.strftime("%m-%d"), region=region)
+
+@functools.lru_cache(maxsize=4)
+def _monospace_font(point_size: int) -> QFont:
+    return QFont(_MONOSPACE_FONT, point_size)
+
+# "group/key" settings names, shared across miners that reuse option names like "path" or "user"
+_KEY_CACHE: Dict[Tuple[str, str], str] = {}
+
+def _settings_key(group: str, key: str) -> str:
+    name = _KEY_CACHE.get((group, key))
+    if name is None:
+        name = _KEY_CACHE[(group, key)] = sys.intern(f"{group}/{key}")
+    return name
+
+# (getter, setter, stored value type) per registered widget type, used by save_settings/load_settings
+_WIDGET_IO = {
+    QLineEdit: (QLineEdit.text, QLineEdit.setText, str),
+    QComboBox: (QComboBox.currentText, QComboBox.setCurrentText, str),
+    QCheckBox: (QCheckBox.isChecked, QCheckBox.setChecked, bool),
+    QSpinBox: (QSpinBox.value, QSpinBox.setValue, int),
+    QDoubleSpinBox: (QDoubleSpinBox.value, QDoubleSpinBox.setValue, float),
+}
+
+def _stored_as(value: Any, value_type: type) -> Any:
+    """Converts a value read back from QSettings (INI files give strings) to what a setter takes."""
+    if value_type is bool:
+        return value.lower() == "true" if isinstance(value, str) else bool(value)
+    if value_type is int:
+        # Tolerates "300.0", as written by older versions or by hand
+        return int(float(value))
+    return value_type(value)
+
+# Change signal per registered widget type, used to schedule a deferred save
+_WIDGET_CHANGED = {
+    QLineEdit: "textChanged", QComboBox: "currentTextChanged", QCheckBox: "toggled",
+    QSpinBox: "valueChanged", QDoubleSpinBox: "valueChanged",
+}
+
+# Widget class per field kind in the *_TAB_SPEC tables ("check" and "pool" are built separately)
+_SPEC_WIDGETS = {"edit": QLineEdit, "combo": QComboBox, "spin": QSpinBox}
+
+# Shared by every settings-row label: height never needs negotiating against the row's widget
+_FIELD_LABEL_POLICY = QSizePolicy(QSizePolicy.Preferred, QSizePolicy.Fixed)
+
+def create_field_label(text: str) -> QLabel:
+    """Plain-text label for a settings row (skips the rich-text sniffing QLabel does by default)."""
+    label = QLabel(text)
+    label.setTextFormat(Qt.PlainText)
+    label.setSizePolicy(_FIELD_LABEL_POLICY)
+    return label
+
+class _ExecCheckSignals(QObject):
+    finished = pyqtSignal(dict)
+
+class ExecCheckRunnable(QRunnable):
+    """Runs check_executable for every miner path on a QThreadPool worker."""
+    def __init__(self, paths: Dict[str, str]):
+        super().__init__()
+        self.paths = dict(paths)
+        self.signals = _ExecCheckSignals()
 
-        filename, _ = QFileDialog.getOpenFileName(parent, title, start_dir)
-        if filename:
-            line_edit.setText(filename)
-    button.clicked.connect(browse)
-    return button
+    def run(self):
+        self.signals.finished.emit({name: check_executable(path) for name, path in self.paths.items()})
+
+class _PriceFetchSignals(QObject):
+    finished = pyqtSignal(bytes, str)
+
+class PriceFetchRunnable(QRunnable):
+    """Downloads one price URL on a QThreadPool worker; emits (content, error text)."""
+    def __init__(self, session: requests.Session, api_url: str):
+        super().__init__()
+        self.session = session
+        self.api_url = api_url
+        self.cancelled = False
+        self.signals = _PriceFetchSignals()
+
+    def run(self):
+        try:
+            resp = self.session.get(self.api_url, timeout=10)
+            resp.raise_for_status()
+        except requests.exceptions.RequestException as e:
+            self._emit(b"", str(e))
+            return
+        self._emit(resp.content, "")
+
+    def _emit(self, content: bytes, error: str):
+        try:
+            self.signals.finished.emit(content, error)
+        except RuntimeError:
+            # The window (and with it the signals object) was torn down during the download
+            pass
+
+class SettingsWriter(QThread):
+    """Applies queued batches of (group, key, value) writes with its own QSettings, off the GUI thread."""
+    _STOP = object()
+
+    def __init__(self, parent: Optional[QObject] = None):
+        super().__init__(parent)
+        self._queue: "queue.Queue[Any]" = queue.Queue()
+
+    def put(self, writes: List[Tuple[str, str, Any]]):
+        self._queue.put(writes)
+
+    def stop(self):
+        """Flushes everything queued so far to disk and waits for the thread to end."""
+        if self.isRunning():
+            self._queue.put(self._STOP)
+            self.wait()
+
+    def run(self):
+        settings = QSettings()
+        unsynced = False
+        while True:
+            batch = self._queue.get()
+            if batch is self._STOP:
+                break
+            unsynced = True
+            # Writes arrive ordered by tab, so each group is entered once per batch
+            for group, writes in itertools.groupby(batch, key=lambda write: write[0]):
+                settings.beginGroup(group)
+                for _, key, value in writes:
+                    settings.setValue(key, value)
+                settings.endGroup()
+            if self._queue.empty():
+                # Burst finished; a sync per burst keeps the file current without one per key
+                settings.sync()
+                unsynced = False
+        # A close usually queues its save just before stopping; that batch is then synced once, not twice
+        if unsynced:
+            settings.sync()
+
+class LogHighlighter(QSyntaxHighlighter):
+    """Colors the plain-text log: a dim timestamp prefix plus an optional color per line.
+
+    The line color is kept as an index in the block's user state, so the
+    document stores no rich-text runs.
+    """
+    _TIMESTAMP_RE = re.compile(r'^\[\d\d:\d\d:\d\d\]')
+
+    def __init__(self, document):
+        super().__init__(document)
+        self._timestamp_format = QTextCharFormat()
+        self._color_formats: List[QTextCharFormat] = []
+        self._color_index: Dict[str, int] = {}
+        self._pending: Optional[Tuple[int, int]] = None
+
+    def set_timestamp_color(self, color: str):
+        self._timestamp_format.setForeground(QColor(color))
+        self.rehighlight()
+
+    def append(self, edit: QPlainTextEdit, text: str, color: Optional[str] = None):
+        """Appends text to edit, drawing its lines in color (None = theme text color)."""
+        state = -1
+        if color:
+            state = self._color_index.get(color, -1)
+            if state < 0:
+                fmt = QTextCharFormat()
+                fmt.setForeground(QColor(color))
+                state = self._color_index[color] = len(self._color_formats)
+                self._color_formats.append(fmt)
+        # appendPlainText highlights the new blocks synchronously; tell highlightBlock
+        # that the last n blocks belong to this call.
+        self._pending = (state, text.count('\n') + 1)
+        try:
+            edit.appendPlainText(text)
+        finally:
+            self._pending = None
+
+    def _in_last_blocks(self, n: int) -> bool:
+        # Counted from the end, so it holds while the block cap trims the start
+        block = self.currentBlock()
+        return block.document().blockCount() - block.blockNumber() <= n
+
+    def highlightBlock(self, text: str):
+        state = self.currentBlockState()
+        if self._pending is not None and self._in_last_blocks(self._pending[1]):
+            state = self._pending[0]
+        self.setCurrentBlockState(state)
+        if state >= 0:
+            self.setFormat(0, len(text), self._color_formats[state])
+        match = self._TIMESTAMP_RE.match(text)
+        if match:
+            self.setFormat(0, match.end(), self._timestamp_format)
 
 # --- Main Application Window ---
 class MinerHubGUI(QMainWindow):
@@ -127,8 +802,29 @@ class MinerHubGUI(QMainWindow):
         self.setGeometry(50, 50, 1100, 850)
 
         self.settings = QSettings()
-        self.widgets_to_save = []
+        # In-memory copy of what is stored, read once; saves only write keys whose value changed
+        self._settings_cache: Dict[str, Any] = {key: self.settings.value(key) for key in self.settings.allKeys()}
+        self._settings_writer = SettingsWriter(self)
+        self._settings_writer.start()
+        # Quitting without a close event (e.g. reset_settings) must still flush and join the writer
+        QApplication.instance().aboutToQuit.connect(self._settings_writer.stop)
+        QApplication.instance().aboutToQuit.connect(self._reap_miners)
+        # One (widget, "group/key", group, key, default, read(), write(value), fetch()) row per persisted widget;
+        # read() returns the signal-fed value, fetch() asks the widget itself
+        self._bindings: List[Tuple[QWidget, str, str, str, Any, Any, Any, Any]] = []
+        # Each registered widget's current value, kept up to date by its change signal
+        self._widget_values: Dict[str, Any] = {}
+        self._pool_combos: List[QComboBox] = []
+        self._settings_loaded = False
+        # Edits are saved (without a disk sync) once they have been quiet for 500 ms
+        self._save_timer = QTimer(self)
+        self._save_timer.setSingleShot(True)
+        self._save_timer.setInterval(500)
+        self._save_timer.timeout.connect(self._save_all)
+        # All pool combos show the same list, so they share one model
+        self._pool_model = QStringListModel(NICEHASH_POOLS, self)
         self.current_theme = "Standard"
+        self._applied_theme_key: Optional[Tuple[str, str]] = None
 
         self.miner_processes: Dict[str, Optional[QProcess]] = {
             "gminer": None,
@@ -136,11 +832,49 @@ class MinerHubGUI(QMainWindow):
             "trex": None,
             "xmrig": None,
         }
+        # Output read from each miner that has not ended its line yet (held for at most one drain tick)
+        self._miner_partial: Dict[str, bytearray] = {miner_key: bytearray() for miner_key in self.miner_processes}
         self.active_miner_key: Optional[str] = None
+        # time.monotonic() of the last price-driven start or stop
+        self._price_switched_at = float("-inf")
+        # Miners the window is still waiting on to exit; None until the first close request
+        self._closing: Optional[set] = None
+        self.exec_status: Dict[str, bool] = {}
+        # Executable name -> resolved file that passed check_executable; dropped when that file changes
+        self._exec_cache: Dict[str, str] = {}
+        self._exec_watcher = QFileSystemWatcher(self)
+        self._exec_watcher.fileChanged.connect(self._forget_executable)
+        self.miner_buttons: Dict[str, Dict[str, QPushButton]] = {}
+        # Per miner, (bound widget getter, emitter, optional skip getter) steps compiled from _CLI_FLAGS when its tab is built
+        self._cli_steps: Dict[str, List[Tuple[Any, Any, Any]]] = {}
+        # Per miner, the last argv its builder returned; dropped when one of its widgets changes
+        self._built_commands: Dict[str, List[str]] = {}
 
         self.polling_active = False
         self.current_price: Optional[float] = None
-        self.log_output = QTextEdit()
+        # One pooled session so price polls reuse the TLS connection
+        self.http = requests.Session()
+        self.http.mount("https://", HTTPAdapter(pool_connections=2, pool_maxsize=4,
+                                                max_retries=Retry(total=2, backoff_factor=0.3)))
+        # Set once for every request; the day's JSON compresses well
+        self.http.headers["Accept-Encoding"] = "gzip"
+        self._prices_url: Optional[str] = None
+        self._prices: List[Tuple[int, int, float]] = []
+        # In-flight download started by poll_prices; stop_polling cancels it
+        self._poll_fetch: Optional[PriceFetchRunnable] = None
+        # Every in-flight download, referenced so its signals outlive the pool's run() call
+        self._price_fetches: set = set()
+        # api_url -> (hash of response bytes, parsed buckets)
+        self._parsed_prices: Dict[str, Tuple[int, List[Tuple[int, int, float]]]] = {}
+        self.log_output = QPlainTextEdit()
+        self._log_highlighter = LogHighlighter(self.log_output.document())
+        self._log_timestamp_color = "#808080"
+        # Log lines are buffered and appended in one chunk per timer tick
+        self._log_buffer = collections.deque()
+        self._log_flush_timer = QTimer(self)
+        self._log_flush_timer.setInterval(100)
+        self._log_flush_timer.timeout.connect(self._flush_log)
+        self._log_flush_timer.start()
 
         self._create_menu()
         self._create_main_widget()
@@ -148,7 +882,13 @@ class MinerHubGUI(QMainWindow):
         self.poll_timer = QTimer(self)
         self.poll_timer.timeout.connect(self.poll_prices)
 
+        self._miner_output_timer = QTimer(self)
+        self._miner_output_timer.setInterval(250)
+        self._miner_output_timer.timeout.connect(self._drain_miner_output)
+        self._miner_output_timer.start()
+
         self.load_settings() # This will also apply the theme
+        self._refresh_log_colors()
 
         QTimer.singleShot(100, self.check_all_executables)
         QTimer.singleShot(150, lambda: self.update_active_miner(0))
@@ -177,8 +917,7 @@ class MinerHubGUI(QMainWindow):
         theme_group = QActionGroup(self)
         theme_group.setExclusive(True)
 
-        themes = ["Standard", "Mörkt", "Ljust", "Nord", "Matrix", "Synthwave", "Dracula"]
-        for theme_name in themes:
+        for theme_name in _THEME_NAMES:
             action = QAction(theme_name, self, checkable=True)
             action.triggered.connect(lambda checked, name=theme_name: self.apply_theme(name))
             theme_menu.addAction(action)
@@ -210,23 +949,23 @@ class MinerHubGUI(QMainWindow):
         polling_group = QGroupBox("Elpriskontroll")
         polling_layout = QGridLayout(polling_group)
         
-        polling_layout.addWidget(QLabel("Region:"), 0, 0)
+        polling_layout.addWidget(create_field_label("Region:"), 0, 0)
         self.region_combo = QComboBox()
         self.region_combo.addItems(["SE1", "SE2", "SE3", "SE4"])
-        self._register_widget(self.region_combo, "polling/region", "SE3")
+        self._register_widget(self.region_combo, "polling", "region", "SE3")
         polling_layout.addWidget(self.region_combo, 0, 1)
 
-        polling_layout.addWidget(QLabel("Starta < (SEK/kWh):"), 1, 0)
+        polling_layout.addWidget(create_field_label("Starta < (SEK/kWh):"), 1, 0)
         self.start_mining_spin = QDoubleSpinBox()
         self.start_mining_spin.setRange(-9999, 9999)
         self.start_mining_spin.setDecimals(3)
-        self._register_widget(self.start_mining_spin, "polling/start_threshold", 0.1)
+        self._register_widget(self.start_mining_spin, "polling", "start_threshold", 0.1)
         polling_layout.addWidget(self.start_mining_spin, 1, 1)
 
-        polling_layout.addWidget(QLabel("Poll Intervall (sek):"), 2, 0)
+        polling_layout.addWidget(create_field_label("Poll Intervall (sek):"), 2, 0)
         self.poll_interval_spin = QSpinBox()
         self.poll_interval_spin.setRange(30, 99999)
-        self._register_widget(self.poll_interval_spin, "polling/interval", 300)
+        self._register_widget(self.poll_interval_spin, "polling", "interval", 300)
         polling_layout.addWidget(self.poll_interval_spin, 2, 1)
 
         self.start_polling_button = QPushButton("Starta Elpriskontroll")
@@ -245,75 +984,143 @@ class MinerHubGUI(QMainWindow):
         log_group = QGroupBox("Logg")
         log_layout = QVBoxLayout(log_group)
         self.log_output.setReadOnly(True)
-        self.log_output.document().setMaximumBlockCount(5000)
+        self.log_output.document().setMaximumBlockCount(LOG_MAX_LINES)
+        # A log needs no undo history or design-metric (print-precision) layout
+        self.log_output.setUndoRedoEnabled(False)
+        self.log_output.document().setUseDesignMetrics(False)
         log_layout.addWidget(self.log_output)
 
         self.miner_tabs = QTabWidget()
-        self.miner_tabs.currentChanged.connect(self.update_active_miner)
         main_layout.addWidget(self.miner_tabs, stretch=1)
 
-        self._create_gminer_tab()
-        self._create_lolminer_tab()
-        self._create_trex_tab()
-        self._create_xmrig_tab()
+        # Tabs start as empty pages and are built the first time they are shown
+        self._tab_pages: Dict[str, QWidget] = {}
+        self._tab_builders = []
+        self._tab_keys: List[str] = []
+        self._built_tabs = set()
+        self._add_lazy_tab("GMiner", "gminer", self._create_gminer_tab)
+        self._add_lazy_tab("lolMiner", "lolminer", self._create_lolminer_tab)
+        self._add_lazy_tab("T-Rex", "trex", self._create_trex_tab)
+        self._add_lazy_tab("XMRig", "xmrig", self._create_xmrig_tab)
+        self._ensure_tab_built(self.miner_tabs.currentIndex())
+        self.miner_tabs.currentChanged.connect(self._ensure_tab_built)
+        self.miner_tabs.currentChanged.connect(self._release_hidden_tabs)
+        self.miner_tabs.currentChanged.connect(self.update_active_miner)
 
         main_layout.addWidget(log_group, stretch=1)
 
     def log_message(self, message: str, error: bool = False, color: Optional[str] = None):
         if hasattr(self, 'log_output') and self.log_output:
             timestamp = time.strftime("%H:%M:%S")
-            # Use current palette's text color if no color is specified
-            default_color = self.palette().color(QPalette.ColorRole.Text).name()
-            final_color = "red" if error else color if color else default_color
-            
-            safe_message = html.escape(str(message))
-            # Use a span with a subtle color for the timestamp
-            timestamp_color = self.palette().color(QPalette.ColorRole.Mid).name()
-            html_log = (
-                f'<span style="color: {timestamp_color};">[{timestamp}]</span> '
-                f'<span style="color: {final_color}; white-space: pre;">{safe_message}</span>'
-            )
-            self.log_output.append(html_log)
-            scrollbar = self.log_output.verticalScrollBar()
-            if scrollbar.value() >= scrollbar.maximum() - 30:
-                scrollbar.setValue(scrollbar.maximum())
+            # None means the current theme's text color
+            final_color = "red" if error else color
+            self._log_buffer.append((f"[{timestamp}] {message}", final_color))
         else:
             print(f"LOG (early): {message}")
 
+    def _refresh_log_colors(self):
+        """Re-reads the timestamp color from the palette; call after the palette changes."""
+        self._log_timestamp_color = self.palette().color(QPalette.ColorRole.Mid).name()
+        self._log_highlighter.set_timestamp_color(self._log_timestamp_color)
+
+    def _flush_log(self):
+        if not self._log_buffer:
+            return
+        scrollbar = self.log_output.verticalScrollBar()
+        at_bottom = scrollbar.value() >= scrollbar.maximum() - 30
+        # A burst longer than the view would be laid out only to be trimmed again; skip
+        # the entries that fall off the top before they reach the document
+        buffered, lines, drop = self._log_buffer, 0, 0
+        for kept, (text, _) in enumerate(reversed(buffered), 1):
+            lines += text.count("\n") + 1
+            if lines >= LOG_MAX_LINES:
+                drop = len(buffered) - kept
+                break
+        for _ in range(drop):
+            buffered.popleft()
+        # Consecutive lines with the same color go in as one appendPlainText call
+        for color, entries in itertools.groupby(self._log_buffer, key=lambda entry: entry[1]):
+            self._log_highlighter.append(self.log_output, "\n".join(text for text, _ in entries), color)
+        self._log_buffer.clear()
+        if at_bottom:
+            scrollbar.setValue(scrollbar.maximum())
+
+    def _miner_path(self, miner_key: str) -> str:
+        """Path from the miner's tab, or from the stored settings if the tab is not built yet."""
+        path_edit = getattr(self, f"{miner_key}_path_edit", None)
+        if path_edit is not None:
+            return path_edit.text().strip()
+        return str(self._settings_cache.get(f"{miner_key}/path", DEFAULT_EXECS[miner_key])).strip()
+
+    def _executable_ok(self, name: str) -> bool:
+        """check_executable, remembered until the watcher reports a change to the binary."""
+        if name in self._exec_cache:
+            return True
+        resolved = resolve_executable(name)
+        if resolved is None:
+            # Nothing to watch yet; a missing binary is looked up again next time
+            return False
+        self._exec_cache[name] = resolved
+        self._exec_watcher.addPath(resolved)
+        return True
+
+    def _forget_executable(self, path: str):
+        for name in [name for name, resolved in self._exec_cache.items() if resolved == path]:
+            del self._exec_cache[name]
+        if path in self._exec_watcher.files():
+            self._exec_watcher.removePath(path)
+
     def check_all_executables(self):
-        if not hasattr(self, 'gminer_path_edit'):
-             QTimer.singleShot(200, self.check_all_executables)
-             return False
-        self.exec_paths = {
-            "gminer": self.gminer_path_edit.text().strip(),
-            "lolminer": self.lolminer_path_edit.text().strip(),
-            "trex": self.trex_path_edit.text().strip(),
-            "xmrig": self.xmrig_path_edit.text().strip(),
-        }
-        self.exec_status = {}
-        all_ok = True
+        self.exec_paths = {miner_key: self._miner_path(miner_key) for miner_key in self.miner_processes}
         self.log_message("Kontrollerar miner-program...")
-        for name, path in self.exec_paths.items():
-            ok = check_executable(path)
-            self.exec_status[name] = ok
+        # Keep a reference so the signal object outlives the pool's run() call
+        self._exec_check_runnable = ExecCheckRunnable(self.exec_paths)
+        self._exec_check_runnable.signals.finished.connect(self._on_exec_check_done)
+        QThreadPool.globalInstance().start(self._exec_check_runnable)
+
+    def _on_exec_check_done(self, results: Dict[str, bool]):
+        self.exec_status = results
+        for name, ok in results.items():
+            path = self.exec_paths.get(name, "")
             if ok:
                 self.log_message(f"✅ {name.capitalize()} hittades: {path}", color="lightgreen")
             else:
                 self.log_message(f"❌ {name.capitalize()} hittades INTE: '{path}'. Kontrollera sökväg under fliken '{name.capitalize()}'.", error=True)
-                all_ok = False
         self._update_manual_button_states()
-        return all_ok
 
     def _update_manual_button_states(self):
-         for miner_key in self.miner_processes.keys():
-              start_button = getattr(self, f"{miner_key}_start_button", None)
-              if start_button:
-                   is_running = self.miner_processes.get(miner_key) and self.miner_processes[miner_key].state() != QProcess.ProcessState.NotRunning
-                   start_button.setEnabled(self.exec_status.get(miner_key, False) and not is_running)
-
-    def _register_widget(self, widget: QWidget, name: str, default_value: Any = None):
+         for miner_key, process in self.miner_processes.items():
+              buttons = self.miner_buttons.get(miner_key)
+              if not buttons: continue
+              is_running = process is not None and process.state() != QProcess.ProcessState.NotRunning
+              buttons["start"].setEnabled(self.exec_status.get(miner_key, False) and not is_running)
+
+    def _register_widget(self, widget: QWidget, group: str, key: str, default_value: Any = None):
+        name = _settings_key(group, key)
         widget.setObjectName(name)
-        self.widgets_to_save.append((widget, default_value))
+        getter, setter, value_type = _WIDGET_IO[type(widget)]
+        # Bound once here; save and argv building read the signal-fed value instead of the widget
+        fetch = getattr(widget, getter.__name__)
+        write = getattr(widget, setter.__name__)
+        self._widget_values[name] = fetch()
+        read = functools.partial(self._widget_values.__getitem__, name)
+        cached = self._settings_cache.get(name)
+        if cached is not None and type(cached) is not value_type:
+            try:
+                self._settings_cache[name] = _stored_as(cached, value_type)
+            except (TypeError, ValueError, OverflowError):
+                # Unreadable value: the widget gets its default, which the next save writes back
+                del self._settings_cache[name]
+        self._bindings.append((widget, name, sys.intern(group), sys.intern(key), default_value, read, write, fetch))
+        getattr(widget, _WIDGET_CHANGED[type(widget)]).connect(functools.partial(self._on_widget_changed, group, name))
+
+    def _on_widget_changed(self, group: str, name: str, value: Any):
+        # Each change signal carries exactly what the widget's getter would return
+        self._widget_values[name] = value
+        # Every input of a miner's command is a registered widget in its group
+        self._built_commands.pop(group, None)
+        # Restarting the single-shot timer coalesces a burst of edits into one save
+        self._save_timer.start()
 
     # ======================================================================
     # === TAB CREATION METHODS (FULLY RESTORED) ===
@@ -325,19 +1132,19 @@ class MinerHubGUI(QMainWindow):
         layout.setContentsMargins(0,0,0,0)
 
         pool_combo = QComboBox()
-        pool_combo.addItems(NICEHASH_POOLS)
+        pool_combo.setModel(self._pool_model)
         pool_combo.setMinimumWidth(350)
         pool_combo.setToolTip("Välj en förinställd NiceHash-pool eller 'Egen' för att skriva in manuellt.")
-        self._register_widget(pool_combo, f"{miner_prefix}/pool_combo", "stratum+tcp://kawpow.auto.nicehash.com:9200")
+        self._register_widget(pool_combo, miner_prefix, "pool_combo", "stratum+tcp://kawpow.auto.nicehash.com:9200")
 
         custom_pool_edit = QLineEdit()
         custom_pool_edit.setPlaceholderText("Ange egen pool URL här...")
-        custom_pool_edit.setEnabled(pool_combo.currentText() == NICEHASH_POOLS[0])
+        custom_pool_edit.setEnabled(pool_combo.currentText() == _CUSTOM_POOL_SENTINEL)
         custom_pool_edit.setToolTip("Aktiveras när du väljer '(Egen / Custom...)' i listan.")
-        self._register_widget(custom_pool_edit, f"{miner_prefix}/custom_pool_edit", "")
+        self._register_widget(custom_pool_edit, miner_prefix, "custom_pool_edit", "")
 
         pool_combo.currentTextChanged.connect(
-            lambda text, edit=custom_pool_edit: edit.setEnabled(text == NICEHASH_POOLS[0])
+            lambda text, edit=custom_pool_edit, sentinel=_CUSTOM_POOL_SENTINEL: edit.setEnabled(text == sentinel)
         )
 
         layout.addWidget(pool_combo)
@@ -345,21 +1152,22 @@ class MinerHubGUI(QMainWindow):
         layout.setStretch(1, 1)
 
         setattr(self, f"{miner_prefix}_pool_combo", pool_combo)
+        self._pool_combos.append(pool_combo)
         setattr(self, f"{miner_prefix}_custom_pool_edit", custom_pool_edit)
 
         return widget
 
     def _get_selected_pool(self, miner_prefix: str) -> Optional[str]:
-        pool_combo = getattr(self, f"{miner_prefix}_pool_combo", None)
-        custom_pool_edit = getattr(self, f"{miner_prefix}_custom_pool_edit", None)
+        values = self._widget_values
+        selected_text = values.get(_settings_key(miner_prefix, "pool_combo"))
+        custom_url = values.get(_settings_key(miner_prefix, "custom_pool_edit"))
 
-        if not pool_combo or not custom_pool_edit:
+        if selected_text is None or custom_url is None:
             self.log_message(f"Internt fel: Kunde inte hitta pool-widgets för {miner_prefix}", error=True)
             return None
 
-        selected_text = pool_combo.currentText()
-        if selected_text == NICEHASH_POOLS[0]:
-            custom_url = custom_pool_edit.text().strip()
+        if selected_text == _CUSTOM_POOL_SENTINEL:
+            custom_url = custom_url.strip()
             if not custom_url:
                  self.log_message(f"Varning: '(Egen / Custom...)' valt för {miner_prefix} men inget URL angetts.", error=True)
                  return None
@@ -371,10 +1179,86 @@ class MinerHubGUI(QMainWindow):
                  self.log_message(f"Varning: Ogiltigt val i pool-listan för {miner_prefix}: {selected_text}", error=True)
                  return None
 
-    def _create_scrollable_tab(self, tab_name: str) -> Tuple[QWidget, QGridLayout]:
+    def _add_lazy_tab(self, tab_name: str, miner_key: str, builder):
         tab_widget = QWidget()
         tab_layout = QVBoxLayout(tab_widget)
         tab_layout.setContentsMargins(5, 5, 5, 5)
+        self._tab_pages[tab_name] = tab_widget
+        self._tab_builders.append(builder)
+        self._tab_keys.append(miner_key)
+        self.miner_tabs.addTab(tab_widget, tab_name)
+
+    def _ensure_tab_built(self, index: int):
+        if index < 0 or index in self._built_tabs:
+            return
+        self._built_tabs.add(index)
+        first_new = len(self._bindings)
+        self._tab_builders[index]()
+        if self._settings_loaded:
+            self._load_all(first_new)
+            self._update_manual_button_states()
+
+    def _release_hidden_tabs(self, current: int):
+        """Saves and tears down built tabs that are neither shown nor running their miner.
+
+        The page stays in the tab bar and is rebuilt from its spec when selected again.
+        """
+        for index in sorted(self._built_tabs - {current}):
+            prefix = self._tab_keys[index]
+            process = self.miner_processes.get(prefix)
+            if process is not None and process.state() != QProcess.ProcessState.NotRunning:
+                continue
+
+            released = [binding for binding in self._bindings if binding[2] == prefix]
+            self._save_all(released)
+            self._bindings = [binding for binding in self._bindings if binding[2] != prefix]
+            for binding in released:
+                self._widget_values.pop(binding[1], None)
+            released_ids = {id(binding[0]) for binding in released}
+            self._pool_combos = [combo for combo in self._pool_combos if id(combo) not in released_ids]
+            for name in [name for name, value in vars(self).items() if id(value) in released_ids]:
+                delattr(self, name)
+            self._cli_steps.pop(prefix, None)
+            self._built_commands.pop(prefix, None)
+            self.miner_buttons.pop(prefix, None)
+
+            page_layout = self.miner_tabs.widget(index).layout()
+            while page_layout.count():
+                item = page_layout.takeAt(0)
+                if item.widget():
+                    item.widget().deleteLater()
+            self._built_tabs.discard(index)
+
+    def _create_browse_button(self, line_edit: QLineEdit, title: str = "Välj fil") -> QPushButton:
+        """Browse button for line_edit; every button shares the _browse_for_file slot."""
+        button = QPushButton("...")
+        button.setFixedWidth(30)
+        button.setProperty("target_edit", line_edit)
+        button.setProperty("dialog_title", title)
+        button.clicked.connect(self._browse_for_file)
+        return button
+
+    def _browse_for_file(self):
+        button = self.sender()
+        line_edit = button.property("target_edit")
+        start_dir = str(Path.home())
+        if line_edit.text():
+            p = Path(line_edit.text())
+            try:
+                if p.exists():
+                     start_dir = str(p.parent if p.is_file() else p)
+                elif p.parent.exists():
+                     start_dir = str(p.parent)
+            except Exception:
+                 pass
+
+        filename, _ = QFileDialog.getOpenFileName(self, button.property("dialog_title"), start_dir)
+        if filename:
+            line_edit.setText(filename)
+
+    def _create_scrollable_tab(self, tab_name: str) -> Tuple[QWidget, QGridLayout]:
+        tab_widget = self._tab_pages[tab_name]
+        tab_layout = tab_widget.layout()
 
         scroll = QScrollArea()
         scroll.setWidgetResizable(True)
@@ -384,8 +1268,6 @@ class MinerHubGUI(QMainWindow):
         grid_layout.setSpacing(10)
         scroll.setWidget(scroll_content)
         tab_layout.addWidget(scroll)
-
-        self.miner_tabs.addTab(tab_widget, tab_name)
         return scroll_content, grid_layout
 
     def _add_manual_start_stop(self, layout: QGridLayout, miner_key: str, start_row: int):
@@ -404,572 +1286,175 @@ class MinerHubGUI(QMainWindow):
 
         layout.addWidget(button_group, start_row, 0, 1, layout.columnCount() if layout.columnCount() > 0 else 1)
 
-        setattr(self, f"{miner_key}_start_button", start_button)
-        setattr(self, f"{miner_key}_stop_button", stop_button)
+        self.miner_buttons[miner_key] = {"start": start_button, "stop": stop_button}
         return start_row + 1
 
     def _create_gminer_tab(self):
-        tab_content, layout = self._create_scrollable_tab("GMiner")
-        row, COLUMNS, prefix = 0, 4, "gminer"
-
-        path_group = QGroupBox("Sökväg"); path_layout = QGridLayout(path_group)
-        path_layout.addWidget(QLabel("GMiner Program:"), 0, 0)
-        self.gminer_path_edit = QLineEdit()
-        self._register_widget(self.gminer_path_edit, f"{prefix}/path", DEFAULT_GMINER_EXEC)
-        path_layout.addWidget(self.gminer_path_edit, 0, 1)
-        path_layout.addWidget(create_browse_button(self.gminer_path_edit, self, "Välj GMiner"), 0, 2)
-        layout.addWidget(path_group, row, 0, 1, COLUMNS); row += 1
-
-        net_group = QGroupBox("Nätverk"); net_layout = QGridLayout(net_group)
-        r = 0
-        net_layout.addWidget(QLabel("Algorithm (-a):"), r, 0)
-        self.gminer_algo_combo = QComboBox()
-        self.gminer_algo_combo.addItems(["ethash", "etchash", "kawpow", "autolykos2", "beamhash", "cuckatoo32", "kheavyhash", "sha512_256d", "ironfish", "octopus", "karlsenhash", "zil", "ethash+kheavyhash", "etchash+kheavyhash"])
-        self._register_widget(self.gminer_algo_combo, f"{prefix}/algo", "kawpow")
-        net_layout.addWidget(self.gminer_algo_combo, r, 1, 1, 2); r+=1
-        net_layout.addWidget(QLabel("Pool (-s):"), r, 0)
-        net_layout.addWidget(self._create_pool_widget(prefix), r, 1, 1, 3); r+=1
-        net_layout.addWidget(QLabel("User (-u):"), r, 0)
-        self.gminer_user_edit = QLineEdit()
-        self._register_widget(self.gminer_user_edit, f"{prefix}/user", DEFAULT_USER)
-        net_layout.addWidget(self.gminer_user_edit, r, 1, 1, 2); r+=1
-        net_layout.addWidget(QLabel("Password (-p):"), r, 0)
-        self.gminer_pass_edit = QLineEdit()
-        self._register_widget(self.gminer_pass_edit, f"{prefix}/pass", "x")
-        net_layout.addWidget(self.gminer_pass_edit, r, 1, 1, 2); r+=1
-        net_layout.addWidget(QLabel("--ssl (on/off):"), r, 0)
-        self.gminer_ssl_combo = QComboBox(); self.gminer_ssl_combo.addItems(["off", "on"])
-        self._register_widget(self.gminer_ssl_combo, f"{prefix}/ssl", "off")
-        net_layout.addWidget(self.gminer_ssl_combo, r, 1); r+=1
-        net_layout.addWidget(QLabel("--proto:"), r, 0)
-        self.gminer_proto_combo = QComboBox(); self.gminer_proto_combo.addItems(["stratum", "proxy"])
-        self._register_widget(self.gminer_proto_combo, f"{prefix}/proto", "stratum")
-        net_layout.addWidget(self.gminer_proto_combo, r, 1); r+=1
-        net_layout.addWidget(QLabel("--proxy (socks5):"), r, 0)
-        self.gminer_proxy_edit = QLineEdit()
-        self._register_widget(self.gminer_proxy_edit, f"{prefix}/proxy", "")
-        net_layout.addWidget(self.gminer_proxy_edit, r, 1, 1, 2); r+=1
-        layout.addWidget(net_group, row, 0, 1, COLUMNS); row += 1
-
-        gpu_group = QGroupBox("GPU"); gpu_layout = QGridLayout(gpu_group); r = 0
-        gpu_layout.addWidget(QLabel("-d, --devices:"), r, 0)
-        self.gminer_devices_edit = QLineEdit(); self._register_widget(self.gminer_devices_edit, f"{prefix}/devices", "")
-        gpu_layout.addWidget(self.gminer_devices_edit, r, 1, 1, 2); r+=1
-        gpu_layout.addWidget(QLabel("-i, --intensity:"), r, 0)
-        self.gminer_intensity_edit = QLineEdit(); self._register_widget(self.gminer_intensity_edit, f"{prefix}/intensity", "")
-        gpu_layout.addWidget(self.gminer_intensity_edit, r, 1, 1, 2); r+=1
-        gpu_layout.addWidget(QLabel("-di, --dual_intensity:"), r, 0)
-        self.gminer_dual_intensity_edit = QLineEdit(); self._register_widget(self.gminer_dual_intensity_edit, f"{prefix}/dual_intensity", "")
-        gpu_layout.addWidget(self.gminer_dual_intensity_edit, r, 1, 1, 2); r+=1
-        gpu_layout.addWidget(QLabel("--fan:"), r, 0)
-        self.gminer_fan_edit = QLineEdit(); self._register_widget(self.gminer_fan_edit, f"{prefix}/fan", "")
-        gpu_layout.addWidget(self.gminer_fan_edit, r, 1, 1, 2); r+=1
-        gpu_layout.addWidget(QLabel("--pl (Power Limit %/W):"), r, 0)
-        self.gminer_pl_edit = QLineEdit(); self._register_widget(self.gminer_pl_edit, f"{prefix}/pl", "")
-        gpu_layout.addWidget(self.gminer_pl_edit, r, 1, 1, 2); r+=1
-        layout.addWidget(gpu_group, row, 0, 1, COLUMNS); row += 1
-
-        oc_group = QGroupBox("Överklockning"); oc_layout = QGridLayout(oc_group); r = 0
-        oc_layout.addWidget(QLabel("--cclock:"), r, 0)
-        self.gminer_cclock_edit = QLineEdit(); self._register_widget(self.gminer_cclock_edit, f"{prefix}/cclock", "")
-        oc_layout.addWidget(self.gminer_cclock_edit, r, 1, 1, 2); r+=1
-        oc_layout.addWidget(QLabel("--mclock:"), r, 0)
-        self.gminer_mclock_edit = QLineEdit(); self._register_widget(self.gminer_mclock_edit, f"{prefix}/mclock", "")
-        oc_layout.addWidget(self.gminer_mclock_edit, r, 1, 1, 2); r+=1
-        oc_layout.addWidget(QLabel("--lock_cclock:"), r, 0)
-        self.gminer_lock_cclock_edit = QLineEdit(); self._register_widget(self.gminer_lock_cclock_edit, f"{prefix}/lock_cclock", "")
-        oc_layout.addWidget(self.gminer_lock_cclock_edit, r, 1, 1, 2); r+=1
-        oc_layout.addWidget(QLabel("--lock_mclock:"), r, 0)
-        self.gminer_lock_mclock_edit = QLineEdit(); self._register_widget(self.gminer_lock_mclock_edit, f"{prefix}/lock_mclock", "")
-        oc_layout.addWidget(self.gminer_lock_mclock_edit, r, 1, 1, 2); r+=1
-        oc_layout.addWidget(QLabel("--mt (Mem Tweak 0-6):"), r, 0)
-        self.gminer_mt_edit = QLineEdit(); self._register_widget(self.gminer_mt_edit, f"{prefix}/mt", "")
-        oc_layout.addWidget(self.gminer_mt_edit, r, 1, 1, 2); r+=1
-        layout.addWidget(oc_group, row, 0, 1, COLUMNS); row += 1
-
-        logmisc_group = QGroupBox("Loggning & Diverse"); logmisc_layout = QGridLayout(logmisc_group); r = 0
-        logmisc_layout.addWidget(QLabel("-l, --logfile:"), r, 0)
-        self.gminer_logfile_edit = QLineEdit(); self._register_widget(self.gminer_logfile_edit, f"{prefix}/logfile", "")
-        logmisc_layout.addWidget(self.gminer_logfile_edit, r, 1)
-        logmisc_layout.addWidget(create_browse_button(self.gminer_logfile_edit, self, "Välj loggfil"), r, 2); r+=1
-        logmisc_layout.addWidget(QLabel("--log_date (0/1):"), r, 0)
-        self.gminer_log_date_spin = QSpinBox(); self.gminer_log_date_spin.setRange(0, 1)
-        self._register_widget(self.gminer_log_date_spin, f"{prefix}/log_date", 0)
-        logmisc_layout.addWidget(self.gminer_log_date_spin, r, 1); r+=1
-        logmisc_layout.addWidget(QLabel("--log_newjob (0/1):"), r, 0)
-        self.gminer_log_newjob_spin = QSpinBox(); self.gminer_log_newjob_spin.setRange(0, 1)
-        self._register_widget(self.gminer_log_newjob_spin, f"{prefix}/log_newjob", 1)
-        logmisc_layout.addWidget(self.gminer_log_newjob_spin, r, 1); r+=1
-        logmisc_layout.addWidget(QLabel("--api (port):"), r, 0)
-        self.gminer_api_edit = QLineEdit(); self._register_widget(self.gminer_api_edit, f"{prefix}/api", "")
-        logmisc_layout.addWidget(self.gminer_api_edit, r, 1); r+=1
-        logmisc_layout.addWidget(QLabel("--config:"), r, 0)
-        self.gminer_config_edit = QLineEdit(); self._register_widget(self.gminer_config_edit, f"{prefix}/config", "")
-        logmisc_layout.addWidget(self.gminer_config_edit, r, 1)
-        logmisc_layout.addWidget(create_browse_button(self.gminer_config_edit, self, "Välj configfil"), r, 2); r+=1
-        self.gminer_color_cb = QCheckBox("-c, --color (Enable)"); self._register_widget(self.gminer_color_cb, f"{prefix}/color", False)
-        logmisc_layout.addWidget(self.gminer_color_cb, r, 0)
-        self.gminer_watchdog_cb = QCheckBox("-w, --watchdog (Enable)"); self._register_widget(self.gminer_watchdog_cb, f"{prefix}/watchdog", True)
-        logmisc_layout.addWidget(self.gminer_watchdog_cb, r, 1); r+=1
-        layout.addWidget(logmisc_group, row, 0, 1, COLUMNS); row += 1
-
-        row = self._add_manual_start_stop(layout, prefix, row)
-        layout.setRowStretch(row, 1)
-
+        self._build_tab_from_spec("GMiner", "gminer", GMINER_TAB_SPEC)
 
     def _create_lolminer_tab(self):
-        tab_content, layout = self._create_scrollable_tab("lolMiner")
-        row, COLUMNS, prefix = 0, 4, "lolminer"
-
-        path_group = QGroupBox("Sökväg"); path_layout = QGridLayout(path_group)
-        path_layout.addWidget(QLabel("lolMiner Program:"), 0, 0)
-        self.lolminer_path_edit = QLineEdit(); self._register_widget(self.lolminer_path_edit, f"{prefix}/path", DEFAULT_LOLMINER_EXEC)
-        path_layout.addWidget(self.lolminer_path_edit, 0, 1)
-        path_layout.addWidget(create_browse_button(self.lolminer_path_edit, self, "Välj lolMiner"), 0, 2)
-        layout.addWidget(path_group, row, 0, 1, COLUMNS); row += 1
-
-        gen_group = QGroupBox("General & Mining"); gen_layout = QGridLayout(gen_group); r = 0
-        gen_layout.addWidget(QLabel("--algo (-a):"), r, 0); self.lolminer_algo_edit = QLineEdit(); self._register_widget(self.lolminer_algo_edit, f"{prefix}/algo", "ETCHASH")
-        gen_layout.addWidget(self.lolminer_algo_edit, r, 1, 1, 2); r+=1
-        gen_layout.addWidget(QLabel("Pool (-p):"), r, 0)
-        gen_layout.addWidget(self._create_pool_widget(prefix), r, 1, 1, 3); r+=1
-        gen_layout.addWidget(QLabel("--user (-u):"), r, 0); self.lolminer_user_edit = QLineEdit(); self._register_widget(self.lolminer_user_edit, f"{prefix}/user", DEFAULT_USER)
-        gen_layout.addWidget(self.lolminer_user_edit, r, 1, 1, 2); r+=1
-        gen_layout.addWidget(QLabel("--pass:"), r, 0); self.lolminer_pass_edit = QLineEdit(); self._register_widget(self.lolminer_pass_edit, f"{prefix}/pass", "x")
-        gen_layout.addWidget(self.lolminer_pass_edit, r, 1, 1, 2); r+=1
-        gen_layout.addWidget(QLabel("--devices:"), r, 0); self.lolminer_devices_edit = QLineEdit(); self._register_widget(self.lolminer_devices_edit, f"{prefix}/devices", "ALL")
-        gen_layout.addWidget(self.lolminer_devices_edit, r, 1, 1, 2); r+=1
-        gen_layout.addWidget(QLabel("--tls (on/off):"), r, 0); self.lolminer_tls_combo = QComboBox(); self.lolminer_tls_combo.addItems(["off", "on"]); self._register_widget(self.lolminer_tls_combo, f"{prefix}/tls", "off")
-        gen_layout.addWidget(self.lolminer_tls_combo, r, 1); r+=1
-        gen_layout.addWidget(QLabel("--socks5:"), r, 0); self.lolminer_socks5_edit = QLineEdit(); self._register_widget(self.lolminer_socks5_edit, f"{prefix}/socks5", "")
-        gen_layout.addWidget(self.lolminer_socks5_edit, r, 1, 1, 2); r+=1
-        gen_layout.addWidget(QLabel("--dns-over-https (0/1/2):"), r, 0); self.lolminer_doh_spin = QSpinBox(); self.lolminer_doh_spin.setRange(0,2); self._register_widget(self.lolminer_doh_spin, f"{prefix}/doh", 1)
-        gen_layout.addWidget(self.lolminer_doh_spin, r, 1)
-        gen_layout.addWidget(QLabel("--benchmark:"), r, 2); self.lolminer_benchmark_edit = QLineEdit(); self.lolminer_benchmark_edit.setToolTip("Ex: KAWPOW"); self._register_widget(self.lolminer_benchmark_edit, f"{prefix}/benchmark", "")
-        gen_layout.addWidget(self.lolminer_benchmark_edit, r, 3); r+=1
-        self.lolminer_devicesbypcie_cb = QCheckBox("--devicesbypcie"); self._register_widget(self.lolminer_devicesbypcie_cb, f"{prefix}/devicesbypcie", False)
-        gen_layout.addWidget(self.lolminer_devicesbypcie_cb, r, 0)
-        self.lolminer_nocolor_cb = QCheckBox("--nocolor"); self._register_widget(self.lolminer_nocolor_cb, f"{prefix}/nocolor", False)
-        gen_layout.addWidget(self.lolminer_nocolor_cb, r, 1)
-        self.lolminer_basecolor_cb = QCheckBox("--basecolor"); self._register_widget(self.lolminer_basecolor_cb, f"{prefix}/basecolor", False)
-        gen_layout.addWidget(self.lolminer_basecolor_cb, r, 2); r+=1
-        gen_layout.addWidget(QLabel("--config:"), r, 0); self.lolminer_config_edit = QLineEdit(); self._register_widget(self.lolminer_config_edit, f"{prefix}/config", "./lolMiner.cfg")
-        gen_layout.addWidget(self.lolminer_config_edit, r, 1)
-        gen_layout.addWidget(create_browse_button(self.lolminer_config_edit, self, "Välj lolMiner Config"), r, 2); r+=1
-        gen_layout.addWidget(QLabel("--json:"), r, 0); self.lolminer_json_edit = QLineEdit(); self._register_widget(self.lolminer_json_edit, f"{prefix}/json", "./user_config.json")
-        gen_layout.addWidget(self.lolminer_json_edit, r, 1)
-        gen_layout.addWidget(create_browse_button(self.lolminer_json_edit, self, "Välj lolMiner JSON"), r, 2); r+=1
-        gen_layout.addWidget(QLabel("--profile:"), r, 0); self.lolminer_profile_edit = QLineEdit(); self._register_widget(self.lolminer_profile_edit, f"{prefix}/profile", "")
-        gen_layout.addWidget(self.lolminer_profile_edit, r, 1, 1, 2); r+=1
-        self.lolminer_no_cl_cb = QCheckBox("--no-cl"); self._register_widget(self.lolminer_no_cl_cb, f"{prefix}/no-cl", False)
-        gen_layout.addWidget(self.lolminer_no_cl_cb, r, 0)
-        self.lolminer_version_cb = QCheckBox("-v (version)"); self._register_widget(self.lolminer_version_cb, f"{prefix}/version", False)
-        gen_layout.addWidget(self.lolminer_version_cb, r, 1); r+=1
-        layout.addWidget(gen_group, row, 0, 1, COLUMNS); row += 1
-
-        man_group = QGroupBox("Managing & Stats"); man_layout = QGridLayout(man_group); r = 0
-        man_layout.addWidget(QLabel("--watchdog:"), r, 0); self.lolminer_watchdog_combo = QComboBox(); self.lolminer_watchdog_combo.addItems(["script", "exit", "off"]); self._register_widget(self.lolminer_watchdog_combo, f"{prefix}/watchdog", "script")
-        man_layout.addWidget(self.lolminer_watchdog_combo, r, 1)
-        man_layout.addWidget(QLabel("--watchdogscript:"), r, 2); self.lolminer_watchdogscript_edit = QLineEdit(); self._register_widget(self.lolminer_watchdogscript_edit, f"{prefix}/watchdogscript", "")
-        man_layout.addWidget(self.lolminer_watchdogscript_edit, r, 3); r+=1
-        man_layout.addWidget(QLabel("--tstart:"), r, 0); self.lolminer_tstart_spin = QSpinBox(); self.lolminer_tstart_spin.setRange(0,120); self._register_widget(self.lolminer_tstart_spin, f"{prefix}/tstart", 0)
-        man_layout.addWidget(self.lolminer_tstart_spin, r, 1)
-        man_layout.addWidget(QLabel("--tstop:"), r, 2); self.lolminer_tstop_spin = QSpinBox(); self.lolminer_tstop_spin.setRange(0,120); self._register_widget(self.lolminer_tstop_spin, f"{prefix}/tstop", 0)
-        man_layout.addWidget(self.lolminer_tstop_spin, r, 3); r+=1
-        man_layout.addWidget(QLabel("--tmode:"), r, 0); self.lolminer_tmode_combo = QComboBox(); self.lolminer_tmode_combo.addItems(["edge", "junction", "memory"]); self._register_widget(self.lolminer_tmode_combo, f"{prefix}/tmode", "edge")
-        man_layout.addWidget(self.lolminer_tmode_combo, r, 1); r+=1
-        man_layout.addWidget(QLabel("--apiport:"), r, 0); self.lolminer_apiport_spin = QSpinBox(); self.lolminer_apiport_spin.setRange(0,65535); self._register_widget(self.lolminer_apiport_spin, f"{prefix}/apiport", 0)
-        man_layout.addWidget(self.lolminer_apiport_spin, r, 1)
-        man_layout.addWidget(QLabel("--apihost:"), r, 2); self.lolminer_apihost_edit = QLineEdit(); self._register_widget(self.lolminer_apihost_edit, f"{prefix}/apihost", "0.0.0.0")
-        man_layout.addWidget(self.lolminer_apihost_edit, r, 3); r+=1
-        man_layout.addWidget(QLabel("--longstats:"), r, 0); self.lolminer_longstats_spin = QSpinBox(); self.lolminer_longstats_spin.setRange(1,9999); self._register_widget(self.lolminer_longstats_spin, f"{prefix}/longstats", 60)
-        man_layout.addWidget(self.lolminer_longstats_spin, r, 1)
-        man_layout.addWidget(QLabel("--shortstats:"), r, 2); self.lolminer_shortstats_spin = QSpinBox(); self.lolminer_shortstats_spin.setRange(1,9999); self._register_widget(self.lolminer_shortstats_spin, f"{prefix}/shortstats", 15)
-        man_layout.addWidget(self.lolminer_shortstats_spin, r, 3); r+=1
-        self.lolminer_timeprint_cb = QCheckBox("--timeprint"); self._register_widget(self.lolminer_timeprint_cb, f"{prefix}/timeprint", False)
-        man_layout.addWidget(self.lolminer_timeprint_cb, r, 0)
-        self.lolminer_compactaccept_cb = QCheckBox("--compactaccept"); self._register_widget(self.lolminer_compactaccept_cb, f"{prefix}/compactaccept", False)
-        man_layout.addWidget(self.lolminer_compactaccept_cb, r, 1); r+=1
-        self.lolminer_log_cb = QCheckBox("--log"); self._register_widget(self.lolminer_log_cb, f"{prefix}/log", False)
-        man_layout.addWidget(self.lolminer_log_cb, r, 0)
-        man_layout.addWidget(QLabel("--logfile:"), r, 1); self.lolminer_logfile_edit = QLineEdit(); self._register_widget(self.lolminer_logfile_edit, f"{prefix}/logfile", "")
-        man_layout.addWidget(self.lolminer_logfile_edit, r, 2)
-        man_layout.addWidget(create_browse_button(self.lolminer_logfile_edit, self, "Välj lolMiner loggfil"), r, 3); r+=1
-        layout.addWidget(man_group, row, 0, 1, COLUMNS); row += 1
-
-        oc_group = QGroupBox("Överklockning (Experimentell)"); oc_layout = QGridLayout(oc_group); r=0
-        oc_layout.addWidget(QLabel("--cclk:"), r, 0); self.lolminer_cclk_edit = QLineEdit(); self._register_widget(self.lolminer_cclk_edit, f"{prefix}/cclk", "*")
-        oc_layout.addWidget(self.lolminer_cclk_edit, r, 1)
-        oc_layout.addWidget(QLabel("--mclk:"), r, 2); self.lolminer_mclk_edit = QLineEdit(); self._register_widget(self.lolminer_mclk_edit, f"{prefix}/mclk", "*")
-        oc_layout.addWidget(self.lolminer_mclk_edit, r, 3); r+=1
-        oc_layout.addWidget(QLabel("--coff:"), r, 0); self.lolminer_coff_edit = QLineEdit(); self._register_widget(self.lolminer_coff_edit, f"{prefix}/coff", "*")
-        oc_layout.addWidget(self.lolminer_coff_edit, r, 1)
-        oc_layout.addWidget(QLabel("--moff:"), r, 2); self.lolminer_moff_edit = QLineEdit(); self._register_widget(self.lolminer_moff_edit, f"{prefix}/moff", "*")
-        oc_layout.addWidget(self.lolminer_moff_edit, r, 3); r+=1
-        oc_layout.addWidget(QLabel("--fan:"), r, 0); self.lolminer_fan_edit = QLineEdit(); self._register_widget(self.lolminer_fan_edit, f"{prefix}/fan", "*")
-        oc_layout.addWidget(self.lolminer_fan_edit, r, 1)
-        oc_layout.addWidget(QLabel("--pl:"), r, 2); self.lolminer_pl_edit = QLineEdit(); self._register_widget(self.lolminer_pl_edit, f"{prefix}/pl", "*")
-        oc_layout.addWidget(self.lolminer_pl_edit, r, 3); r+=1
-        self.lolminer_no_oc_reset_cb = QCheckBox("--no-oc-reset"); self._register_widget(self.lolminer_no_oc_reset_cb, f"{prefix}/no-oc-reset", False)
-        oc_layout.addWidget(self.lolminer_no_oc_reset_cb, r, 0); r+=1
-        layout.addWidget(oc_group, row, 0, 1, COLUMNS); row += 1
-
-        eth_group = QGroupBox("Ethash/Altcoin/Dual"); eth_layout = QGridLayout(eth_group); r=0
-        eth_layout.addWidget(QLabel("--ethstratum:"), r, 0); self.lolminer_ethstratum_combo = QComboBox(); self.lolminer_ethstratum_combo.addItems(["ETHV1", "ETHPROXY"]); self._register_widget(self.lolminer_ethstratum_combo, f"{prefix}/ethstratum", "ETHV1")
-        eth_layout.addWidget(self.lolminer_ethstratum_combo, r, 1)
-        eth_layout.addWidget(QLabel("--worker (Eth):"), r, 2); self.lolminer_worker_eth_edit = QLineEdit(); self._register_widget(self.lolminer_worker_eth_edit, f"{prefix}/worker_eth", "eth1.0")
-        eth_layout.addWidget(self.lolminer_worker_eth_edit, r, 3); r+=1
-        eth_layout.addWidget(QLabel("--lhrtune:"), r, 0); self.lolminer_lhrtune_edit = QLineEdit(); self._register_widget(self.lolminer_lhrtune_edit, f"{prefix}/lhrtune", "auto")
-        eth_layout.addWidget(self.lolminer_lhrtune_edit, r, 1); r+=1
-        eth_layout.addWidget(QLabel("--dualmode:"), r, 0); self.lolminer_dualmode_combo = QComboBox(); self.lolminer_dualmode_combo.addItems(["none", "zil", "zilEx", "eth", "etc"]); self._register_widget(self.lolminer_dualmode_combo, f"{prefix}/dualmode", "none")
-        eth_layout.addWidget(self.lolminer_dualmode_combo, r, 1)
-        eth_layout.addWidget(QLabel("--dualpool:"), r, 2); self.lolminer_dualpool_edit = QLineEdit(); self._register_widget(self.lolminer_dualpool_edit, f"{prefix}/dualpool", "")
-        eth_layout.addWidget(self.lolminer_dualpool_edit, r, 3); r+=1
-        eth_layout.addWidget(QLabel("--dualuser:"), r, 0); self.lolminer_dualuser_edit = QLineEdit(); self._register_widget(self.lolminer_dualuser_edit, f"{prefix}/dualuser", "")
-        eth_layout.addWidget(self.lolminer_dualuser_edit, r, 1)
-        eth_layout.addWidget(QLabel("--dualpass:"), r, 2); self.lolminer_dualpass_edit = QLineEdit(); self._register_widget(self.lolminer_dualpass_edit, f"{prefix}/dualpass", "")
-        eth_layout.addWidget(self.lolminer_dualpass_edit, r, 3); r+=1
-        layout.addWidget(eth_group, row, 0, 1, COLUMNS); row += 1
-
-        row = self._add_manual_start_stop(layout, prefix, row)
-        layout.setRowStretch(row, 1)
+        self._build_tab_from_spec("lolMiner", "lolminer", LOLMINER_TAB_SPEC)
 
     def _create_trex_tab(self):
-        tab_content, layout = self._create_scrollable_tab("T-Rex")
-        row, COLUMNS, prefix = 0, 4, "trex"
-
-        path_group = QGroupBox("Sökväg"); path_layout = QGridLayout(path_group)
-        path_layout.addWidget(QLabel("T-Rex Program:"), 0, 0)
-        self.trex_path_edit = QLineEdit(); self._register_widget(self.trex_path_edit, f"{prefix}/path", DEFAULT_TREX_EXEC)
-        path_layout.addWidget(self.trex_path_edit, 0, 1)
-        path_layout.addWidget(create_browse_button(self.trex_path_edit, self, "Välj T-Rex"), 0, 2)
-        layout.addWidget(path_group, row, 0, 1, COLUMNS); row += 1
-
-        net_group = QGroupBox("Nätverk"); net_layout = QGridLayout(net_group); r=0
-        net_layout.addWidget(QLabel("Algorithm (-a):"), r, 0); self.trex_algo_combo = QComboBox(); self.trex_algo_combo.addItems(["autolykos2", "blake3", "etchash", "ethash", "firopow", "kawpow", "mtp", "mtp-tcr", "multi", "octopus", "progpow", "progpow-veil", "progpow-veriblock", "progpowz", "tensority"]); self._register_widget(self.trex_algo_combo, f"{prefix}/algo", "kawpow")
-        net_layout.addWidget(self.trex_algo_combo, r, 1, 1, 2); r+=1
-        net_layout.addWidget(QLabel("--coin:"), r, 0); self.trex_coin_edit = QLineEdit(); self._register_widget(self.trex_coin_edit, f"{prefix}/coin", "")
-        net_layout.addWidget(self.trex_coin_edit, r, 1, 1, 2); r+=1
-        net_layout.addWidget(QLabel("URL (-o):"), r, 0)
-        net_layout.addWidget(self._create_pool_widget(prefix), r, 1, 1, 3); r+=1
-        net_layout.addWidget(QLabel("User (-u):"), r, 0); self.trex_user_edit = QLineEdit(); self._register_widget(self.trex_user_edit, f"{prefix}/user", DEFAULT_USER)
-        net_layout.addWidget(self.trex_user_edit, r, 1, 1, 2); r+=1
-        net_layout.addWidget(QLabel("Password (-p):"), r, 0); self.trex_pass_edit = QLineEdit(); self._register_widget(self.trex_pass_edit, f"{prefix}/pass", "x")
-        net_layout.addWidget(self.trex_pass_edit, r, 1, 1, 2); r+=1
-        net_layout.addWidget(QLabel("--worker (-w):"), r, 0); self.trex_worker_edit = QLineEdit(); self._register_widget(self.trex_worker_edit, f"{prefix}/worker", "rig0")
-        net_layout.addWidget(self.trex_worker_edit, r, 1, 1, 2); r+=1
-        net_layout.addWidget(QLabel("--url2:"), r, 0); self.trex_url2_edit = QLineEdit(); self._register_widget(self.trex_url2_edit, f"{prefix}/url2", "")
-        net_layout.addWidget(self.trex_url2_edit, r, 1, 1, 2); r+=1
-        net_layout.addWidget(QLabel("--user2:"), r, 0); self.trex_user2_edit = QLineEdit(); self._register_widget(self.trex_user2_edit, f"{prefix}/user2", "")
-        net_layout.addWidget(self.trex_user2_edit, r, 1, 1, 2); r+=1
-        net_layout.addWidget(QLabel("--pass2:"), r, 0); self.trex_pass2_edit = QLineEdit(); self._register_widget(self.trex_pass2_edit, f"{prefix}/pass2", "")
-        net_layout.addWidget(self.trex_pass2_edit, r, 1, 1, 2); r+=1
-        net_layout.addWidget(QLabel("--worker2:"), r, 0); self.trex_worker2_edit = QLineEdit(); self._register_widget(self.trex_worker2_edit, f"{prefix}/worker2", "")
-        net_layout.addWidget(self.trex_worker2_edit, r, 1, 1, 2); r+=1
-        layout.addWidget(net_group, row, 0, 1, COLUMNS); row += 1
-
-        gpu_group = QGroupBox("GPU & Överklockning"); gpu_layout = QGridLayout(gpu_group); r=0
-        gpu_layout.addWidget(QLabel("--devices (-d):"), r, 0); self.trex_devices_edit = QLineEdit(); self._register_widget(self.trex_devices_edit, f"{prefix}/devices", "")
-        gpu_layout.addWidget(self.trex_devices_edit, r, 1)
-        gpu_layout.addWidget(QLabel("--intensity (-i):"), r, 2); self.trex_intensity_edit = QLineEdit(); self._register_widget(self.trex_intensity_edit, f"{prefix}/intensity", "")
-        gpu_layout.addWidget(self.trex_intensity_edit, r, 3); r+=1
-        gpu_layout.addWidget(QLabel("--pl:"), r, 0); self.trex_pl_edit = QLineEdit(); self._register_widget(self.trex_pl_edit, f"{prefix}/pl", "")
-        gpu_layout.addWidget(self.trex_pl_edit, r, 1)
-        gpu_layout.addWidget(QLabel("--fan:"), r, 2); self.trex_fan_edit = QLineEdit(); self._register_widget(self.trex_fan_edit, f"{prefix}/fan", "")
-        gpu_layout.addWidget(self.trex_fan_edit, r, 3); r+=1
-        gpu_layout.addWidget(QLabel("--lock-cclock:"), r, 0); self.trex_lock_cclock_edit = QLineEdit(); self._register_widget(self.trex_lock_cclock_edit, f"{prefix}/lock-cclock", "")
-        gpu_layout.addWidget(self.trex_lock_cclock_edit, r, 1)
-        gpu_layout.addWidget(QLabel("--cclock:"), r, 2); self.trex_cclock_edit = QLineEdit(); self._register_widget(self.trex_cclock_edit, f"{prefix}/cclock", "")
-        gpu_layout.addWidget(self.trex_cclock_edit, r, 3); r+=1
-        gpu_layout.addWidget(QLabel("--lock-cv:"), r, 0); self.trex_lock_cv_edit = QLineEdit(); self._register_widget(self.trex_lock_cv_edit, f"{prefix}/lock-cv", "")
-        gpu_layout.addWidget(self.trex_lock_cv_edit, r, 1)
-        gpu_layout.addWidget(QLabel("--mclock:"), r, 2); self.trex_mclock_edit = QLineEdit(); self._register_widget(self.trex_mclock_edit, f"{prefix}/mclock", "")
-        gpu_layout.addWidget(self.trex_mclock_edit, r, 3); r+=1
-        gpu_layout.addWidget(QLabel("--mt:"), r, 0); self.trex_mt_edit = QLineEdit(); self._register_widget(self.trex_mt_edit, f"{prefix}/mt", "")
-        gpu_layout.addWidget(self.trex_mt_edit, r, 1)
-        self.trex_low_load_cb = QCheckBox("--low-load"); self._register_widget(self.trex_low_load_cb, f"{prefix}/low-load", False)
-        gpu_layout.addWidget(self.trex_low_load_cb, r, 2); r+=1
-        layout.addWidget(gpu_group, row, 0, 1, COLUMNS); row += 1
-
-        lhr_group = QGroupBox("LHR"); lhr_layout = QGridLayout(lhr_group); r=0
-        lhr_layout.addWidget(QLabel("--lhr-tune:"), r, 0); self.trex_lhr_tune_edit = QLineEdit(); self._register_widget(self.trex_lhr_tune_edit, f"{prefix}/lhr-tune", "-1")
-        lhr_layout.addWidget(self.trex_lhr_tune_edit, r, 1)
-        lhr_layout.addWidget(QLabel("--lhr-autotune-mode:"), r, 2); self.trex_lhr_autotune_combo = QComboBox(); self.trex_lhr_autotune_combo.addItems(["off", "down", "full"]); self._register_widget(self.trex_lhr_autotune_combo, f"{prefix}/lhr-autotune-mode", "down")
-        lhr_layout.addWidget(self.trex_lhr_autotune_combo, r, 3); r+=1
-        layout.addWidget(lhr_group, row, 0, 1, COLUMNS); row += 1
-
-        misc_group = QGroupBox("Diverse"); misc_layout = QGridLayout(misc_group); r=0
-        misc_layout.addWidget(QLabel("--api-bind-http:"), r, 0); self.trex_api_bind_edit = QLineEdit(); self._register_widget(self.trex_api_bind_edit, f"{prefix}/api-bind-http", "127.0.0.1:4067")
-        misc_layout.addWidget(self.trex_api_bind_edit, r, 1)
-        self.trex_api_https_cb = QCheckBox("--api-https"); self._register_widget(self.trex_api_https_cb, f"{prefix}/api-https", False)
-        misc_layout.addWidget(self.trex_api_https_cb, r, 2); r+=1
-        misc_layout.addWidget(QLabel("--api-key:"), r, 0); self.trex_api_key_edit = QLineEdit(); self._register_widget(self.trex_api_key_edit, f"{prefix}/api-key", "")
-        misc_layout.addWidget(self.trex_api_key_edit, r, 1)
-        self.trex_api_read_only_cb = QCheckBox("--api-read-only"); self._register_widget(self.trex_api_read_only_cb, f"{prefix}/api-read-only", False)
-        misc_layout.addWidget(self.trex_api_read_only_cb, r, 2); r+=1
-        self.trex_no_watchdog_cb = QCheckBox("--no-watchdog"); self._register_widget(self.trex_no_watchdog_cb, f"{prefix}/no-watchdog", False)
-        misc_layout.addWidget(self.trex_no_watchdog_cb, r, 0)
-        self.trex_protocol_dump_cb = QCheckBox("-P, --protocol-dump"); self._register_widget(self.trex_protocol_dump_cb, f"{prefix}/protocol-dump", False)
-        misc_layout.addWidget(self.trex_protocol_dump_cb, r, 1); r+=1
-        misc_layout.addWidget(QLabel("--log-path (-l):"), r, 0); self.trex_log_path_edit = QLineEdit(); self._register_widget(self.trex_log_path_edit, f"{prefix}/log-path", "")
-        misc_layout.addWidget(self.trex_log_path_edit, r, 1)
-        self.trex_quiet_cb = QCheckBox("--quiet (-q)"); self._register_widget(self.trex_quiet_cb, f"{prefix}/quiet", False)
-        misc_layout.addWidget(self.trex_quiet_cb, r, 2); r+=1
-        misc_layout.addWidget(QLabel("--watchdog-exit-mode:"), r, 0); self.trex_watchdog_exit_edit = QLineEdit(); self.trex_watchdog_exit_edit.setToolTip("Ex: r:10,s:600"); self._register_widget(self.trex_watchdog_exit_edit, f"{prefix}/watchdog-exit-mode", "")
-        misc_layout.addWidget(self.trex_watchdog_exit_edit, r, 1, 1, 2); r+=1
-        misc_layout.addWidget(QLabel("-c, --config:"), r, 0); self.trex_config_edit = QLineEdit(); self._register_widget(self.trex_config_edit, f"{prefix}/config", "")
-        misc_layout.addWidget(self.trex_config_edit, r, 1)
-        misc_layout.addWidget(create_browse_button(self.trex_config_edit, self, "Välj T-Rex Config"), r, 2); r+=1
-        self.trex_benchmark_cb = QCheckBox("-B, --benchmark"); self._register_widget(self.trex_benchmark_cb, f"{prefix}/benchmark", False)
-        misc_layout.addWidget(self.trex_benchmark_cb, r, 0)
-        self.trex_no_color_cb = QCheckBox("--no-color"); self._register_widget(self.trex_no_color_cb, f"{prefix}/no-color", False)
-        misc_layout.addWidget(self.trex_no_color_cb, r, 1); r+=1
-        layout.addWidget(misc_group, row, 0, 1, COLUMNS); row += 1
-
-        row = self._add_manual_start_stop(layout, prefix, row)
-        layout.setRowStretch(row, 1)
+        self._build_tab_from_spec("T-Rex", "trex", TREX_TAB_SPEC)
 
     def _create_xmrig_tab(self):
-        tab_content, layout = self._create_scrollable_tab("XMRig")
-        row, COLUMNS, prefix = 0, 4, "xmrig"
-
-        path_group = QGroupBox("Sökväg"); path_layout = QGridLayout(path_group)
-        path_layout.addWidget(QLabel("XMRig Program:"), 0, 0)
-        self.xmrig_path_edit = QLineEdit(); self._register_widget(self.xmrig_path_edit, f"{prefix}/path", DEFAULT_XMRIG_EXEC)
-        path_layout.addWidget(self.xmrig_path_edit, 0, 1)
-        path_layout.addWidget(create_browse_button(self.xmrig_path_edit, self, "Välj XMRig"), 0, 2)
-        layout.addWidget(path_group, row, 0, 1, COLUMNS); row += 1
-
-        xmrig_options_tabs = QTabWidget()
-        net_tab = QWidget(); net_layout = QGridLayout(net_tab); r=0
-        net_layout.addWidget(QLabel("URL (-o):"), r, 0)
-        net_layout.addWidget(self._create_pool_widget(prefix), r, 1, 1, 3); r+=1
-        net_layout.addWidget(QLabel("Algo (-a):"), r, 0); self.xmrig_algo_edit = QLineEdit(); self._register_widget(self.xmrig_algo_edit, f"{prefix}/algo", "randomx")
-        net_layout.addWidget(self.xmrig_algo_edit, r, 1)
-        net_layout.addWidget(QLabel("--coin:"), r, 2); self.xmrig_coin_edit = QLineEdit(); self._register_widget(self.xmrig_coin_edit, f"{prefix}/coin", "")
-        net_layout.addWidget(self.xmrig_coin_edit, r, 3); r+=1
-        net_layout.addWidget(QLabel("User (-u):"), r, 0); self.xmrig_user_edit = QLineEdit(); self._register_widget(self.xmrig_user_edit, f"{prefix}/user", DEFAULT_USER)
-        net_layout.addWidget(self.xmrig_user_edit, r, 1, 1, 3); r+=1
-        net_layout.addWidget(QLabel("Password (-p):"), r, 0); self.xmrig_pass_edit = QLineEdit(); self._register_widget(self.xmrig_pass_edit, f"{prefix}/pass", "x")
-        net_layout.addWidget(self.xmrig_pass_edit, r, 1)
-        net_layout.addWidget(QLabel("User:Pass (-O):"), r, 2); self.xmrig_userpass_edit = QLineEdit(); self._register_widget(self.xmrig_userpass_edit, f"{prefix}/userpass", "")
-        net_layout.addWidget(self.xmrig_userpass_edit, r, 3); r+=1
-        net_layout.addWidget(QLabel("Proxy (-x):"), r, 0); self.xmrig_proxy_edit = QLineEdit(); self._register_widget(self.xmrig_proxy_edit, f"{prefix}/proxy", "")
-        net_layout.addWidget(self.xmrig_proxy_edit, r, 1)
-        net_layout.addWidget(QLabel("--rig-id:"), r, 2); self.xmrig_rigid_edit = QLineEdit(); self._register_widget(self.xmrig_rigid_edit, f"{prefix}/rig-id", "")
-        net_layout.addWidget(self.xmrig_rigid_edit, r, 3); r+=1
-        self.xmrig_keepalive_cb = QCheckBox("-k"); self._register_widget(self.xmrig_keepalive_cb, f"{prefix}/keepalive", False); net_layout.addWidget(self.xmrig_keepalive_cb, r, 0)
-        self.xmrig_nicehash_cb = QCheckBox("--nicehash"); self._register_widget(self.xmrig_nicehash_cb, f"{prefix}/nicehash", False); net_layout.addWidget(self.xmrig_nicehash_cb, r, 1)
-        self.xmrig_tls_cb = QCheckBox("--tls"); self._register_widget(self.xmrig_tls_cb, f"{prefix}/tls", False); net_layout.addWidget(self.xmrig_tls_cb, r, 2); r+=1
-        net_layout.addWidget(QLabel("--tls-fingerprint:"), r, 0); self.xmrig_tls_fp_edit = QLineEdit(); self._register_widget(self.xmrig_tls_fp_edit, f"{prefix}/tls-fingerprint", "")
-        net_layout.addWidget(self.xmrig_tls_fp_edit, r, 1, 1, 3); r+=1
-        self.xmrig_daemon_cb = QCheckBox("--daemon"); self._register_widget(self.xmrig_daemon_cb, f"{prefix}/daemon", False); net_layout.addWidget(self.xmrig_daemon_cb, r, 0)
-        self.xmrig_dns_ipv6_cb = QCheckBox("--dns-ipv6"); self._register_widget(self.xmrig_dns_ipv6_cb, f"{prefix}/dns-ipv6", False); net_layout.addWidget(self.xmrig_dns_ipv6_cb, r, 1); r+=1
-        net_layout.setRowStretch(r, 1); xmrig_options_tabs.addTab(net_tab, "Network")
-
-        cpu_tab = QWidget(); cpu_layout = QGridLayout(cpu_tab); r=0
-        self.xmrig_no_cpu_cb = QCheckBox("--no-cpu"); self._register_widget(self.xmrig_no_cpu_cb, f"{prefix}/no-cpu", False); cpu_layout.addWidget(self.xmrig_no_cpu_cb, r, 0, 1, 2); r+=1
-        cpu_layout.addWidget(QLabel("Threads (-t):"), r, 0); self.xmrig_threads_edit = QLineEdit(); self._register_widget(self.xmrig_threads_edit, f"{prefix}/threads", "")
-        cpu_layout.addWidget(self.xmrig_threads_edit, r, 1)
-        cpu_layout.addWidget(QLabel("--cpu-affinity:"), r, 2); self.xmrig_cpu_affinity_edit = QLineEdit(); self._register_widget(self.xmrig_cpu_affinity_edit, f"{prefix}/cpu-affinity", "")
-        cpu_layout.addWidget(self.xmrig_cpu_affinity_edit, r, 3); r+=1
-        cpu_layout.addWidget(QLabel("Algo Var (-v):"), r, 0); self.xmrig_av_spin = QSpinBox(); self.xmrig_av_spin.setRange(0, 99); self._register_widget(self.xmrig_av_spin, f"{prefix}/av", 0)
-        cpu_layout.addWidget(self.xmrig_av_spin, r, 1)
-        cpu_layout.addWidget(QLabel("--cpu-priority:"), r, 2); self.xmrig_cpu_priority_spin = QSpinBox(); self.xmrig_cpu_priority_spin.setRange(0, 5); self._register_widget(self.xmrig_cpu_priority_spin, f"{prefix}/cpu-priority", 2)
-        cpu_layout.addWidget(self.xmrig_cpu_priority_spin, r, 3); r+=1
-        self.xmrig_no_huge_pages_cb = QCheckBox("--no-huge-pages"); self._register_widget(self.xmrig_no_huge_pages_cb, f"{prefix}/no-huge-pages", False); cpu_layout.addWidget(self.xmrig_no_huge_pages_cb, r, 0)
-        self.xmrig_randomx_no_numa_cb = QCheckBox("--randomx-no-numa"); self._register_widget(self.xmrig_randomx_no_numa_cb, f"{prefix}/randomx-no-numa", False); cpu_layout.addWidget(self.xmrig_randomx_no_numa_cb, r, 1); r+=1
-        cpu_layout.setRowStretch(r, 1); xmrig_options_tabs.addTab(cpu_tab, "CPU")
-
-        other_tab = QWidget(); other_layout = QGridLayout(other_tab); r=0
-        other_layout.addWidget(QLabel("--http-port:"), r, 0); self.xmrig_http_port_spin = QSpinBox(); self.xmrig_http_port_spin.setRange(0, 65535); self._register_widget(self.xmrig_http_port_spin, f"{prefix}/http-port", 0)
-        other_layout.addWidget(self.xmrig_http_port_spin, r, 1)
-        other_layout.addWidget(QLabel("--http-access-token:"), r, 2); self.xmrig_http_access_token_edit = QLineEdit(); self._register_widget(self.xmrig_http_access_token_edit, f"{prefix}/http-access-token", "")
-        other_layout.addWidget(self.xmrig_http_access_token_edit, r, 3); r+=1
-        other_layout.addWidget(QLabel("--log-file (-l):"), r, 0); self.xmrig_log_file_edit = QLineEdit(); self._register_widget(self.xmrig_log_file_edit, f"{prefix}/log-file", "")
-        other_layout.addWidget(self.xmrig_log_file_edit, r, 1)
-        other_layout.addWidget(create_browse_button(self.xmrig_log_file_edit, self, "Välj loggfil"), r, 2); r+=1
-        self.xmrig_verbose_cb = QCheckBox("--verbose"); self._register_widget(self.xmrig_verbose_cb, f"{prefix}/verbose", False); other_layout.addWidget(self.xmrig_verbose_cb, r, 0)
-        self.xmrig_background_cb = QCheckBox("-B"); self._register_widget(self.xmrig_background_cb, f"{prefix}/background", False); other_layout.addWidget(self.xmrig_background_cb, r, 1); r+=1
-        other_layout.addWidget(QLabel("-c, --config:"), r, 0); self.xmrig_config_file_edit = QLineEdit(); self._register_widget(self.xmrig_config_file_edit, f"{prefix}/config", "")
-        other_layout.addWidget(self.xmrig_config_file_edit, r, 1)
-        other_layout.addWidget(create_browse_button(self.xmrig_config_file_edit, self, "Välj XMRig Config"), r, 2); r+=1
-        other_layout.setRowStretch(r, 1); xmrig_options_tabs.addTab(other_tab, "API/Log/Misc")
-
-        layout.addWidget(xmrig_options_tabs, row, 0, 1, COLUMNS); row += 1
-
-        row = self._add_manual_start_stop(layout, prefix, row)
+        self._build_tab_from_spec("XMRig", "xmrig", XMRIG_TAB_SPEC)
+
+    def _build_tab_from_spec(self, tab_name: str, prefix: str, spec):
+        page = self._tab_pages[tab_name]
+        page.setUpdatesEnabled(False)
+        tab_content, layout = self._create_scrollable_tab(tab_name)
+        COLUMNS = 4
+
+        # Groups are filled while still detached, then inserted in one pass
+        groups = []
+        for title, rows in spec:
+            if title is None:
+                group = QTabWidget()
+                for page_title, page_rows in rows:
+                    sub_page = QWidget(); page_layout = QGridLayout(sub_page)
+                    self._fill_grid_from_spec(page_layout, prefix, page_rows)
+                    page_layout.setRowStretch(len(page_rows), 1)
+                    group.addTab(sub_page, page_title)
+            else:
+                group = QGroupBox(title)
+                self._fill_grid_from_spec(QGridLayout(group), prefix, rows)
+            groups.append(group)
+        for row, group in enumerate(groups):
+            layout.addWidget(group, row, 0, 1, COLUMNS)
+
+        row = self._add_manual_start_stop(layout, prefix, len(groups))
         layout.setRowStretch(row, 1)
+        page.setUpdatesEnabled(True)
+        self._compile_cli_steps(prefix)
+
+    def _compile_cli_steps(self, prefix: str):
+        """Pairs each flag's emitter with its widget's bound reader, so building argv is a flat loop.
+
+        Consecutive rows sharing an "unless" widget become one run, so its state is read once per build.
+        """
+        readers = {id(binding[0]): binding[5] for binding in self._bindings if binding[2] == prefix}
+        reader = lambda attr: readers[id(getattr(self, attr))]
+        runs = itertools.groupby(_CLI_FLAGS.get(prefix, ()), key=lambda row: row[2] if len(row) > 2 else None)
+        self._cli_steps[prefix] = [
+            (reader(unless) if unless else None, tuple((reader(row[0]), row[1]) for row in rows))
+            for unless, rows in runs
+        ]
+
+    def _cli_args(self, prefix: str) -> Iterator[str]:
+        # Emitters hand back () or a short tuple; chain flattens them straight into the caller's cmd
+        return itertools.chain.from_iterable(
+            emit(read())
+            for skip, run in self._cli_steps[prefix] if skip is None or not skip()
+            for read, emit in run
+        )
+
+    def _fill_grid_from_spec(self, grid: QGridLayout, prefix: str, rows):
+        for r, fields in enumerate(rows):
+            for f in fields:
+                kind, col, span = f["kind"], f["col"], f["span"]
+                if kind == "check":
+                    widget = QCheckBox(f["label"])
+                    grid.addWidget(widget, r, col, 1, span)
+                else:
+                    grid.addWidget(create_field_label(f["label"]), r, col)
+                    if kind == "pool":
+                        grid.addWidget(self._create_pool_widget(prefix), r, col + 1, 1, span)
+                        continue
+                    widget = _SPEC_WIDGETS[kind]()
+                    if "items" in f: widget.addItems(f["items"])
+                    if "range" in f: widget.setRange(*f["range"])
+                    grid.addWidget(widget, r, col + 1, 1, span)
+                    if "browse" in f:
+                        grid.addWidget(self._create_browse_button(widget, f["browse"]), r, col + 2)
+                if "tooltip" in f: widget.setToolTip(f["tooltip"])
+                self._register_widget(widget, prefix, f["key"], f["default"])
+                setattr(self, f["attr"], widget)
 
     # ======================================================================
     # === THEME, SETTINGS & POLLING LOGIC ===
     # ======================================================================
     
     def apply_theme(self, theme_name: str):
+        # Re-applying the current (theme, font) would only re-polish every widget for nothing
+        theme_key = (theme_name, _MONOSPACE_FONT)
+        if theme_key == self._applied_theme_key:
+            return
         self.current_theme = theme_name
         self.log_message(f"Applicerar tema: {theme_name}", color="lightblue")
-        
-        # Base font size
-        font_size = "9pt"
-        monospace_font = "Monospace"
-        
-        # Base styles
-        base_style = f"font-size: {font_size};"
-        
-        # Stylesheets
-        style = ""
-        if theme_name == "Standard":
-            QApplication.instance().setStyleSheet("")
-            QApplication.instance().setPalette(QApplication.style().standardPalette())
-            self.log_output.setFont(QFont(monospace_font, 9))
-            self.update_price_label(self.current_price) # Re-apply label color
-            return
 
-        elif theme_name == "Mörkt":
-            style = f"""
-                QWidget {{ {base_style} background-color: #2b2b2b; color: #f0f0f0; border: 1px solid #3c3c3c; }}
-                QMainWindow, QMenuBar, QMenu {{ background-color: #2b2b2b; color: #f0f0f0; }}
-                QGroupBox {{ background-color: #313131; border-radius: 4px; padding-top: 10px; margin-top: 5px; }}
-                QGroupBox::title {{ subcontrol-origin: margin; subcontrol-position: top center; padding: 0 5px; }}
-                QLineEdit, QTextEdit, QSpinBox, QDoubleSpinBox, QComboBox {{ background-color: #3c3c3c; color: #f0f0f0; border: 1px solid #555; padding: 2px; }}
-                QPushButton {{ background-color: #4d4d4d; color: #f0f0f0; border: 1px solid #555; padding: 5px; }}
-                QPushButton:hover {{ background-color: #5a5a5a; }}
-                QPushButton:pressed {{ background-color: #636363; }}
-                QPushButton:disabled {{ background-color: #404040; color: #888; }}
-                QTabWidget::pane {{ border: 1px solid #3c3c3c; }}
-                QTabBar::tab {{ background: #2b2b2b; padding: 6px; }}
-                QTabBar::tab:selected {{ background: #4d4d4d; }}
-                QCheckBox::indicator {{ width: 13px; height: 13px; border: 1px solid #555;}}
-                QCheckBox::indicator:checked {{ background-color: #5e81ac; }}
-            """
-        elif theme_name == "Ljust":
-            style = f"""
-                QWidget {{ {base_style} background-color: #ffffff; color: #000000; border: 1px solid #dcdcdc; }}
-                QMainWindow, QMenuBar, QMenu {{ background-color: #f0f0f0; color: #000000; }}
-                QGroupBox {{ background-color: #fafafa; border-radius: 4px; padding-top: 10px; margin-top: 5px; }}
-                QGroupBox::title {{ subcontrol-origin: margin; subcontrol-position: top center; padding: 0 5px; }}
-                QLineEdit, QTextEdit, QSpinBox, QDoubleSpinBox, QComboBox {{ background-color: #ffffff; color: #000000; border: 1px solid #cccccc; padding: 2px; }}
-                QPushButton {{ background-color: #e1e1e1; color: #000000; border: 1px solid #cccccc; padding: 5px; }}
-                QPushButton:hover {{ background-color: #d1d1d1; }}
-                QPushButton:pressed {{ background-color: #c1c1c1; }}
-                QPushButton:disabled {{ background-color: #f5f5f5; color: #aaaaaa; }}
-                QTabWidget::pane {{ border: 1px solid #dcdcdc; }}
-                QTabBar::tab {{ background: #f0f0f0; padding: 6px; }}
-                QTabBar::tab:selected {{ background: #ffffff; }}
-            """
-        elif theme_name == "Nord":
-            style = f"""
-                QWidget {{ {base_style} background-color: #2E3440; color: #D8DEE9; border: 1px solid #4C566A; }}
-                QMainWindow, QMenuBar, QMenu {{ background-color: #2E3440; color: #D8DEE9; }}
-                QGroupBox {{ background-color: #3B4252; border-radius: 4px; padding-top: 10px; margin-top: 5px; }}
-                QGroupBox::title {{ subcontrol-origin: margin; subcontrol-position: top center; padding: 0 5px; color: #E5E9F0;}}
-                QLineEdit, QTextEdit, QSpinBox, QDoubleSpinBox, QComboBox {{ background-color: #434C5E; color: #ECEFF4; border: 1px solid #4C566A; padding: 2px; }}
-                QPushButton {{ background-color: #5E81AC; color: #ECEFF4; border: none; padding: 5px; }}
-                QPushButton:hover {{ background-color: #81A1C1; }}
-                QPushButton:pressed {{ background-color: #88C0D0; }}
-                QPushButton:disabled {{ background-color: #4C566A; color: #D8DEE9; }}
-                QTabWidget::pane {{ border: 1px solid #4C566A; }}
-                QTabBar::tab {{ background: #2E3440; padding: 6px; }}
-                QTabBar::tab:selected {{ background: #434C5E; }}
-                QCheckBox::indicator {{ border: 1px solid #4C566A; }}
-                QCheckBox::indicator:checked {{ background-color: #88C0D0; }}
-            """
-        elif theme_name == "Matrix":
-            monospace_font = "Monospace"
-            style = f"""
-                QWidget {{ {base_style} background-color: #000000; color: #00FF00; border: 1px solid #00FF00; font-family: {monospace_font}; }}
-                QMainWindow, QMenuBar, QMenu {{ background-color: #000000; color: #00FF00; }}
-                QGroupBox {{ background-color: #0A0A0A; border: 1px solid #00FF00; border-radius: 4px; padding-top: 10px; margin-top: 5px; }}
-                QGroupBox::title {{ subcontrol-origin: margin; subcontrol-position: top center; padding: 0 5px;}}
-                QLineEdit, QTextEdit, QSpinBox, QDoubleSpinBox, QComboBox {{ background-color: #050505; color: #39FF14; border: 1px solid #00FF00; padding: 2px; }}
-                QPushButton {{ background-color: #080808; color: #00FF00; border: 1px solid #00FF00; padding: 5px; }}
-                QPushButton:hover {{ background-color: #111; color: #39FF14; }}
-                QPushButton:pressed {{ background-color: #222; }}
-                QPushButton:disabled {{ background-color: #050505; color: #008F00; }}
-                QTabWidget::pane {{ border: 1px solid #00FF00; }}
-                QTabBar::tab {{ background: #000000; padding: 6px; }}
-                QTabBar::tab:selected {{ background: #1A1A1A; }}
-            """
-        elif theme_name == "Synthwave":
-            style = f"""
-                QWidget {{ {base_style} background-color: #262335; color: #FFD4E9; border: 1px solid #73479A; }}
-                QMainWindow, QMenuBar, QMenu {{ background-color: #1D1A2A; color: #FFD4E9; }}
-                QGroupBox {{ background-color: #352F4E; border-radius: 4px; padding-top: 10px; margin-top: 5px; }}
-                QGroupBox::title {{ subcontrol-origin: margin; subcontrol-position: top center; padding: 0 5px; color: #F92A82; }}
-                QLineEdit, QTextEdit, QSpinBox, QDoubleSpinBox, QComboBox {{ background-color: #1D1A2A; color: #FFF; border: 1px solid #73479A; padding: 2px; }}
-                QPushButton {{ background-color: #F92A82; color: #FFF; border: none; padding: 5px; }}
-                QPushButton:hover {{ background-color: #FF57AC; }}
-                QPushButton:pressed {{ background-color: #C72267; }}
-                QPushButton:disabled {{ background-color: #73479A; color: #B392C9; }}
-                QTabWidget::pane {{ border: 1px solid #73479A; }}
-                QTabBar::tab {{ background: #262335; padding: 6px; }}
-                QTabBar::tab:selected {{ background: #352F4E; }}
-                QCheckBox::indicator {{ border: 1px solid #73479A; }}
-                QCheckBox::indicator:checked {{ background-color: #00FFFF; }}
-            """
-        elif theme_name == "Dracula":
-            style = f"""
-                QWidget {{ {base_style} background-color: #282a36; color: #f8f8f2; border: 1px solid #44475a; }}
-                QMainWindow, QMenuBar, QMenu {{ background-color: #282a36; color: #f8f8f2; }}
-                QGroupBox {{ background-color: #333644; border-radius: 4px; padding-top: 10px; margin-top: 5px; }}
-                QGroupBox::title {{ subcontrol-origin: margin; subcontrol-position: top center; padding: 0 5px; color: #bd93f9; }}
-                QLineEdit, QTextEdit, QSpinBox, QDoubleSpinBox, QComboBox {{ background-color: #44475a; color: #f8f8f2; border: 1px solid #6272a4; padding: 2px; }}
-                QPushButton {{ background-color: #6272a4; color: #f8f8f2; border: none; padding: 5px; }}
-                QPushButton:hover {{ background-color: #7284b8; }}
-                QPushButton:pressed {{ background-color: #526294; }}
-                QPushButton:disabled {{ background-color: #3b3d4a; color: #6272a4; }}
-                QTabWidget::pane {{ border: 1px solid #44475a; }}
-                QTabBar::tab {{ background: #282a36; padding: 6px; }}
-                QTabBar::tab:selected {{ background: #44475a; }}
-                QCheckBox::indicator {{ border: 1px solid #6272a4; }}
-                QCheckBox::indicator:checked {{ background-color: #ff79c6; }}
-            """
-
-        QApplication.instance().setStyleSheet(style)
+        # Palette first so the stylesheet polishes against the new text colours
+        app = QApplication.instance()
+        app.setPalette(_theme_palette(theme_name))
+        app.setStyleSheet(_theme_sheet(*theme_key))
+        self._applied_theme_key = theme_key
         # Apply specific font to log output
-        self.log_output.setFont(QFont(monospace_font, 9))
+        self.log_output.setFont(_monospace_font(9))
+        self._refresh_log_colors()
         self.update_price_label(self.current_price) # Re-apply label color
-        # Also need to reset the log message color
-        self.log_message(f"Tema '{theme_name}' applicerat.", color="#50fa7b" if theme_name == "Dracula" else "lightgreen")
+        if theme_name != "Standard":
+            # Also need to reset the log message color
+            self.log_message(f"Tema '{theme_name}' applicerat.", color="#50fa7b" if theme_name == "Dracula" else "lightgreen")
 
 
     def save_settings(self):
         self.log_message("Sparar inställningar...")
-        # Save theme
-        self.settings.setValue("ui/theme", self.current_theme)
-
-        for widget, _ in self.widgets_to_save:
-            key = widget.objectName()
-            if not key: continue
-            value = None
-            if isinstance(widget, QLineEdit): value = widget.text()
-            elif isinstance(widget, QComboBox): value = widget.currentText()
-            elif isinstance(widget, QCheckBox): value = widget.isChecked()
-            elif isinstance(widget, (QSpinBox, QDoubleSpinBox)): value = widget.value()
-            if value is not None: self.settings.setValue(key, value)
-        self.settings.sync()
+        # Theme and widgets go to the writer as one batch
+        changed = []
+        if self._settings_cache.get("ui/theme") != self.current_theme:
+            self._settings_cache["ui/theme"] = self.current_theme
+            changed.append(("ui", "theme", self.current_theme))
+        self._save_all(changed=changed)
+
+    def _save_all(self, bindings=None, changed=None):
+        """Queues every binding whose value differs from the cache as a single write batch."""
+        cache = self._settings_cache
+        changed = [] if changed is None else changed
+        for _, name, group, key, _, read, _, _ in (self._bindings if bindings is None else bindings):
+            value = read()
+            if cache.get(name) != value:
+                changed.append((group, key, value))
+                cache[name] = value
+        if changed:
+            self._settings_writer.put(changed)
 
     def load_settings(self):
         self.log_message("Laddar inställningar...")
         
         # Load theme first
-        theme_name = self.settings.value("ui/theme", "Standard")
+        theme_name = self._settings_cache.get("ui/theme", "Standard")
         action_name = f"theme_action_{theme_name.lower()}"
         if hasattr(self, action_name):
             getattr(self, action_name).setChecked(True)
         self.apply_theme(theme_name)
 
-        for widget, default_value in self.widgets_to_save:
-            key = widget.objectName()
-            if not key: continue
-            
-            value = self.settings.value(key, default_value)
-
-            if isinstance(widget, QLineEdit): widget.setText(str(value))
-            elif isinstance(widget, QComboBox): widget.setCurrentText(str(value))
-            elif isinstance(widget, QCheckBox): widget.setChecked(str(value).lower() == 'true' if isinstance(value, (str, bool)) else bool(value))
-            elif isinstance(widget, QDoubleSpinBox): widget.setValue(float(value))
-            elif isinstance(widget, QSpinBox): widget.setValue(int(float(value))) 
+        self._load_all()
+        self._settings_loaded = True
+
+    def _load_all(self, first: int = 0):
+        """Loads stored values into the widgets registered from index first onwards."""
+        entries = self._bindings[first:]
+        cache = self._settings_cache
+        values = self._widget_values
+        for widget, name, _, _, default_value, _, write, fetch in entries:
+            name_known = name in cache
+            # Block change signals while restoring; linked widgets are synced below
+            with QSignalBlocker(widget):
+                write(cache.get(name, default_value))
+            # The blocked signal did not record the new value
+            values[name] = fetch()
+            if name_known:
+                # Cache what the widget reports, so an untouched value is not rewritten on save
+                cache[name] = values[name]
+
+        # Signals were blocked above, so drop the restored miners' argv here
+        for group in {entry[2] for entry in entries}:
+            self._built_commands.pop(group, None)
+        restored = {id(entry[0]) for entry in entries}
+        for pool_combo in self._pool_combos:
+            if id(pool_combo) in restored:
+                pool_combo.currentTextChanged.emit(pool_combo.currentText())
     
     def reset_settings(self):
         reply = QMessageBox.question(self, "Återställ Inställningar",
@@ -979,15 +1464,19 @@ class MinerHubGUI(QMainWindow):
                                      QMessageBox.StandardButton.No)
         if reply == QMessageBox.StandardButton.Yes:
             self.log_message("Återställer alla inställningar...", color="orange")
+            self._save_timer.stop()
+            self._settings_writer.stop()
             self.settings.clear()
             self.settings.sync()
+            self._settings_cache.clear()
             QApplication.instance().quit()
             QProcess.startDetached(sys.executable, sys.argv)
 
     def fetch_and_display_initial_price(self):
         self.log_message("Hämtar initialt elpris...")
-        api_url = self.get_api_url()
-        prices = self.fetch_prices(api_url)
+        self._request_prices(self.get_api_url(), self._show_initial_price)
+
+    def _show_initial_price(self, prices):
         price_now = self.get_current_price_from_api(prices)
         if price_now is not None:
             self.current_price = price_now
@@ -998,19 +1487,13 @@ class MinerHubGUI(QMainWindow):
             self.update_price_label(None)
 
     def update_active_miner(self, index):
-        if index < 0:
-             self.active_miner_key = None
-             return
-        tab_text = self.miner_tabs.tabText(index).lower()
-        if "gminer" in tab_text: self.active_miner_key = "gminer"
-        elif "lolminer" in tab_text: self.active_miner_key = "lolminer"
-        elif "t-rex" in tab_text: self.active_miner_key = "trex"
-        elif "xmrig" in tab_text: self.active_miner_key = "xmrig"
-        else: self.active_miner_key = None
+        self.active_miner_key = self._tab_keys[index] if 0 <= index < len(self._tab_keys) else None
 
     def start_polling(self):
         if self.polling_active: return
         self.polling_active = True
+        # The dwell damps price flapping; it must not hold back an explicit (re)start
+        self._price_switched_at = float("-inf")
         self.log_message("▶️ Startar elpriskontroll...")
         self.poll_interval = self.poll_interval_spin.value()
         self.poll_timer.start(self.poll_interval * 1000)
@@ -1022,6 +1505,9 @@ class MinerHubGUI(QMainWindow):
         if not self.polling_active: return
         self.polling_active = False
         self.poll_timer.stop()
+        if self._poll_fetch is not None:
+            self._poll_fetch.cancelled = True
+            self._poll_fetch = None
         self.log_message("⏹ Stoppar elpriskontroll.")
         if self.active_miner_key and self.miner_processes.get(self.active_miner_key):
             self.log_message(f"   ↳ Stoppar {self.active_miner_key.capitalize()} som styrdes av elpriset.")
@@ -1036,9 +1522,14 @@ class MinerHubGUI(QMainWindow):
 
     def poll_prices(self):
         if not self.polling_active: return
+        if self._poll_fetch is not None:
+            self.log_message("Föregående prishämtning pågår fortfarande, hoppar över.")
+            return
         self.log_message(f"⏰ Polling elpris (Intervall: {self.poll_interval_spin.value()}s)...")
-        api_url = self.get_api_url()
-        prices = self.fetch_prices(api_url)
+        self._poll_fetch = self._request_prices(self.get_api_url(), self._apply_polled_price)
+
+    def _apply_polled_price(self, prices):
+        self._poll_fetch = None
         price_now = self.get_current_price_from_api(prices)
         if price_now is not None:
             self.current_price = price_now
@@ -1048,12 +1539,27 @@ class MinerHubGUI(QMainWindow):
             if not self.active_miner_key:
                  self.log_message("Ingen aktiv miner-flik vald för elpriskontroll.")
                  return
-            if price_now < threshold:
-                self.log_message(f"Pris ({price_now:.3f}) < Tröskel ({threshold:.3f}). Startar/behåller {self.active_miner_key.capitalize()}.")
-                self.start_miner_process(self.active_miner_key)
+            miner_key = self.active_miner_key
+            name = miner_key.capitalize()
+            running = self._miner_running(miner_key)
+            # A running miner may go PRICE_HYSTERESIS_SEK over the threshold before it is stopped
+            want_running = price_now < (threshold + PRICE_HYSTERESIS_SEK if running else threshold)
+            if want_running == running:
+                if running:
+                    self.log_message(f"Pris ({price_now:.3f}) < Tröskel ({threshold:.3f} + {PRICE_HYSTERESIS_SEK:.2f}). Behåller {name}.")
+                else:
+                    self.log_message(f"Pris ({price_now:.3f}) >= Tröskel ({threshold:.3f}). {name} förblir stoppad.")
+            elif time.monotonic() - self._price_switched_at < MIN_DWELL_SECONDS:
+                self.log_message(f"{name} ändrades för mindre än {MIN_DWELL_SECONDS} s sedan. Väntar till nästa kontroll.")
+            elif want_running:
+                self.log_message(f"Pris ({price_now:.3f}) < Tröskel ({threshold:.3f}). Startar {name}.")
+                self.start_miner_process(miner_key)
+                if self._miner_running(miner_key):
+                    self._price_switched_at = time.monotonic()
             else:
-                self.log_message(f"Pris ({price_now:.3f}) >= Tröskel ({threshold:.3f}). Stoppar {self.active_miner_key.capitalize()}.")
-                self.stop_miner_process(self.active_miner_key)
+                self.log_message(f"Pris ({price_now:.3f}) >= Tröskel ({threshold:.3f} + {PRICE_HYSTERESIS_SEK:.2f}). Stoppar {name}.")
+                self.stop_miner_process(miner_key)
+                self._price_switched_at = time.monotonic()
         else:
             self.log_message("Kunde inte hämta aktuellt elpris.", error=True)
             self.update_price_label(None)
@@ -1062,43 +1568,124 @@ class MinerHubGUI(QMainWindow):
                  self.stop_miner_process(self.active_miner_key)
 
     def get_api_url(self):
-        now = datetime.now()
-        return BASE_API_URL.format(year=now.year, month_day=now.strftime("%m-%d"), region=self.region_combo.currentText())
+        return _api_url(date.today(), self.region_combo.currentText())
+
+    def _price_cache_path(self, api_url: str) -> Path:
+        """Maps .../{year}/{month_day}_{region}.json to elpris_cache/{region}_{year}-{month_day}.json."""
+        year, file_name = api_url.rsplit("/", 2)[-2:]
+        month_day, region = Path(file_name).stem.split("_", 1)
+        cache_dir = Path(QStandardPaths.writableLocation(QStandardPaths.AppDataLocation)) / "elpris_cache"
+        return cache_dir / f"{region}_{year}-{month_day}.json"
 
-    def fetch_prices(self, api_url):
+    def _read_price_cache(self, cache_path: Path) -> Optional[bytes]:
+        """Returns the cached response if the file was written after today's midnight in Stockholm."""
         try:
-            resp = requests.get(api_url, timeout=10)
-            resp.raise_for_status()
-            return resp.json()
-        except requests.exceptions.RequestException as e:
-            self.log_message(f"Nätverksfel vid hämtning av priser: {e}", error=True)
-            return []
-        except json.JSONDecodeError:
-            self.log_message(f"Kunde inte tolka JSON-svar från API", error=True)
-            return []
+            midnight = STOCKHOLM_TZ.localize(datetime.combine(datetime.now(STOCKHOLM_TZ).date(), dt_time()))
+            if cache_path.stat().st_mtime <= midnight.timestamp():
+                return None
+            return cache_path.read_bytes()
+        except OSError:
+            return None
 
-    def get_current_price_from_api(self, prices):
-        if not prices or not isinstance(prices, list): return None
+    def _write_price_cache(self, cache_path: Path, content: bytes):
         try:
-            target_tz = pytz.timezone("Europe/Stockholm")
-            now_local = datetime.now(target_tz)
-            for entry in prices:
-                if not isinstance(entry, dict) or not all(k in entry for k in ["time_start", "time_end", "SEK_per_kWh"]): continue
-                start_time_local = datetime.fromisoformat(entry["time_start"]).astimezone(target_tz)
-                end_time_local = datetime.fromisoformat(entry["time_end"]).astimezone(target_tz)
-                if start_time_local <= now_local < end_time_local:
-                    return float(entry["SEK_per_kWh"])
-            self.log_message("Kunde inte hitta pris för aktuell timme i API-svaret.", error=True)
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = cache_path.with_suffix(".tmp")
+            tmp_path.write_bytes(content)
+            os.replace(tmp_path, cache_path)
+        except OSError as e:
+            self.log_message(f"Kunde inte spara priscache: {e}", error=True)
+
+    def _request_prices(self, api_url: str, handler) -> Optional[PriceFetchRunnable]:
+        """Calls handler(prices) with start-sorted (start_epoch, end_epoch, SEK/kWh) buckets.
+
+        Cached days are handled at once; otherwise the download runs on the thread
+        pool and the returned runnable can be cancelled until its result arrives.
+        """
+        prices = self._cached_prices(api_url)
+        if prices is not None:
+            handler(prices)
             return None
-        except Exception as e:
+        runnable = PriceFetchRunnable(self.http, api_url)
+        runnable.signals.finished.connect(functools.partial(self._on_prices_fetched, runnable, handler))
+        self._price_fetches.add(runnable)
+        QThreadPool.globalInstance().start(runnable)
+        return runnable
+
+    def _cached_prices(self, api_url: str) -> Optional[List[Tuple[int, int, float]]]:
+        # Same URL means same day and region, so the parsed buckets can be reused
+        if api_url == self._prices_url and self._prices:
+            return self._prices
+        content = self._read_price_cache(self._price_cache_path(api_url))
+        prices = self._parse_prices(api_url, content) if content else None
+        if prices:
+            self._prices_url, self._prices = api_url, prices
+            return prices
+        return None
+
+    def _on_prices_fetched(self, runnable: PriceFetchRunnable, handler, content: bytes, error: str):
+        self._price_fetches.discard(runnable)
+        if runnable.cancelled:
+            return
+        if error:
+            self.log_message(f"Nätverksfel vid hämtning av priser: {error}", error=True)
+            handler([])
+            return
+        api_url = runnable.api_url
+        prices = self._parse_prices(api_url, content)
+        if prices is None:
+            self.log_message(f"Kunde inte tolka JSON-svar från API", error=True)
+            prices = []
+        elif prices:
+            self._write_price_cache(self._price_cache_path(api_url), content)
+            self._prices_url, self._prices = api_url, prices
+        handler(prices)
+
+    def _parse_prices(self, api_url: str, content: bytes) -> Optional[List[Tuple[int, int, float]]]:
+        """Normalises a response into buckets; None if it is not JSON.
+
+        The last parse per URL is kept with a hash of its bytes, so refetching an
+        unchanged day (region switched back, cache file reread) skips fromisoformat.
+        """
+        digest = hash(content)
+        parsed = self._parsed_prices.get(api_url)
+        if parsed and parsed[0] == digest:
+            return parsed[1]
+        try:
+            entries = _loads(content)
+        except ValueError:
+            return None
+        if not isinstance(entries, list):
+            return []
+        try:
+            buckets = sorted(
+                (int(datetime.fromisoformat(entry["time_start"]).timestamp()),
+                 int(datetime.fromisoformat(entry["time_end"]).timestamp()),
+                 float(entry["SEK_per_kWh"]))
+                for entry in entries
+                if isinstance(entry, dict) and all(k in entry for k in ["time_start", "time_end", "SEK_per_kWh"])
+            )
+        except (TypeError, ValueError) as e:
             self.log_message(f"Fel vid tolkning av prisdata: {e}", error=True)
             traceback.print_exc()
-            return None
+            return []
+        self._parsed_prices[api_url] = (digest, buckets)
+        return buckets
+
+    def get_current_price_from_api(self, prices):
+        if not prices: return None
+        now = int(time.time())
+        # (now, inf) sorts after every bucket that starts at or before now
+        idx = bisect.bisect_right(prices, (now, float("inf"))) - 1
+        if idx >= 0 and now < prices[idx][1]:
+            return prices[idx][2]
+        self.log_message("Kunde inte hitta pris för aktuell timme i API-svaret.", error=True)
+        return None
 
     def update_price_label(self, price: Optional[float]):
         # We now use a palette for theming instead of a stylesheet string
         p = self.current_price_label.palette()
-        p.setColor(QPalette.ColorRole.WindowText, self.palette().color(QPalette.ColorRole.Text))
+        p.setColor(QPalette.ColorRole.WindowText, self.palette().color(QPalette.ColorRole.WindowText))
 
         if price is None:
             self.current_price_label.setText("Aktuellt elpris: N/A")
@@ -1134,19 +1721,14 @@ class MinerHubGUI(QMainWindow):
         if self.miner_processes.get(miner_key) and self.miner_processes[miner_key].state() != QProcess.ProcessState.NotRunning:
             if manual_start: self.log_message(f"{miner_key.capitalize()} körs redan.")
             return
-        builder_func = getattr(self, f"build_{miner_key}_command", None)
-        if not builder_func: return
-        cmd_list = builder_func()
+        cmd_list = self._miner_command(miner_key)
         if not cmd_list: return
         executable, args = cmd_list[0], cmd_list[1:]
-        if not check_executable(executable):
+        if not self._executable_ok(executable):
              self.log_message(f"Körbar fil för {miner_key.capitalize()} ({executable}) hittades inte.", error=True)
              return
         self.log_message(f"Startar {miner_key.capitalize()}: {shlex.join(cmd_list)}")
-        process = QProcess(self)
-        process.setProcessChannelMode(QProcess.ProcessChannelMode.MergedChannels)
-        process.readyReadStandardOutput.connect(lambda mk=miner_key: self.handle_miner_output(mk))
-        process.finished.connect(lambda exitCode, exitStatus, mk=miner_key: self.handle_miner_finished(mk, exitCode, exitStatus))
+        process = self._make_miner_process(miner_key)
         try:
             process.start(executable, args)
             if process.state() == QProcess.ProcessState.NotRunning: raise RuntimeError(process.errorString())
@@ -1155,249 +1737,263 @@ class MinerHubGUI(QMainWindow):
             self._update_specific_manual_buttons(miner_key, is_running=True)
         except Exception as e:
             self.log_message(f"Misslyckades starta {miner_key.capitalize()}: {e}", error=True)
+            # e.g. the execute bit was dropped, which the watcher does not always report
+            self._exec_cache.pop(executable, None)
             self._update_specific_manual_buttons(miner_key, is_running=False)
 
+    def _miner_command(self, miner_key: str) -> Optional[List[str]]:
+        cmd_list = self._built_commands.get(miner_key)
+        if cmd_list is None:
+            builder_func = getattr(self, f"build_{miner_key}_command", None)
+            # A released tab has no widgets to read
+            if not builder_func or miner_key not in self._cli_steps: return None
+            try:
+                cmd_list = builder_func()
+            except Exception as e:
+                self.log_message(f"Fel vid byggande av {miner_key.capitalize()}-kommando: {e}", error=True)
+                return None
+            # Failed builds are not kept, so their warnings are logged again next time
+            if cmd_list: self._built_commands[miner_key] = cmd_list
+        return cmd_list
+
+    def _make_miner_process(self, miner_key: str) -> QProcess:
+        process = QProcess(self)
+        # stdout and stderr arrive as one raw byte stream, decoded in handle_miner_output
+        process.setProcessChannelMode(QProcess.ProcessChannelMode.MergedChannels)
+        # Output is left in QProcess's own buffer and drained by _miner_output_timer,
+        # so readyReadStandardOutput is deliberately not connected
+        process.finished.connect(lambda exitCode, exitStatus, mk=miner_key: self.handle_miner_finished(mk, exitCode, exitStatus))
+        return process
+
+    def _miner_running(self, miner_key: str) -> bool:
+        """True while the miner runs and has not been asked to stop."""
+        process = self.miner_processes.get(miner_key)
+        return (process is not None and process.state() != QProcess.ProcessState.NotRunning
+                and not process.property("stopping"))
+
     def stop_miner_process(self, miner_key: str, manual_stop: bool = False):
         process = self.miner_processes.get(miner_key)
         if process and process.state() != QProcess.ProcessState.NotRunning:
             self.log_message(f"Stoppar {miner_key.capitalize()} (PID: {process.processId()})...")
-            process.kill()
-            process.waitForFinished(5000)
-        elif manual_stop:
+            # Ask politely and return at once; handle_miner_finished does the cleanup and
+            # the kill only happens if the miner ignores SIGTERM
+            process.setProperty("stopping", True)
+            process.terminate()
+            QTimer.singleShot(MINER_KILL_GRACE_MS, functools.partial(self._kill_if_running, process))
+            # Neither button applies until it has exited; handle_miner_finished re-enables Start
+            buttons = self.miner_buttons.get(miner_key)
+            if buttons:
+                buttons["start"].setEnabled(False)
+                buttons["stop"].setEnabled(False)
+            return
+        if manual_stop:
             self.log_message(f"{miner_key.capitalize()} kördes inte.")
         self._update_specific_manual_buttons(miner_key, is_running=False)
 
-    def handle_miner_output(self, miner_key: str):
+    def _kill_if_running(self, process: QProcess):
+        if process.state() != QProcess.ProcessState.NotRunning:
+            self.log_message(f"Processen (PID: {process.processId()}) avslutades inte, dödar den.", error=True)
+            process.kill()
+
+    def _drain_miner_output(self):
+        for miner_key, process in self.miner_processes.items():
+            if process is not None:
+                self.handle_miner_output(miner_key)
+
+    def handle_miner_output(self, miner_key: str, final: bool = False):
         process = self.miner_processes.get(miner_key)
+        pending = self._miner_partial[miner_key]
+        held = len(pending)
         if process and process.bytesAvailable() > 0:
-            output_bytes = process.readAllStandardOutput()
+            pending += bytes(process.readAllStandardOutput())
+        # Only complete lines (ending in \n, or \r for redrawn status lines) are logged, so a
+        # split escape code is rarely seen half. A partial line waits at most one drain tick,
+        # and never grows past MINER_PENDING_MAX_BYTES.
+        if final:
+            end = len(pending)
+        elif held or len(pending) > MINER_PENDING_MAX_BYTES:
+            end = len(pending)
+            # Flushing mid-line, but an escape code still arriving stays for the next chunk
+            esc = pending.rfind(b'\x1b', max(0, end - 32))
+            if esc >= 0 and not _ANSI_ESCAPE_BYTES.match(pending, esc):
+                end = esc
+        else:
+            end = max(pending.rfind(b'\n'), pending.rfind(b'\r')) + 1
+        if end > 0:
+            output_bytes = pending[:end]
+            del pending[:end]
+            # Miners run without colour (or between coloured lines) emit no escapes at all
+            if b'\x1b' in output_bytes:
+                output_bytes = _ANSI_ESCAPE_BYTES.sub(b'', output_bytes)
             try:
-                output_text = output_bytes.data().decode('utf-8', errors='replace').strip()
-                if output_text:
-                    cleaned_text = strip_ansi_codes(output_text)
-                    log_color = {"Dracula": "#8be9fd", "Synthwave": "#00FFFF"}.get(self.current_theme, "#00008B") # DarkBlue
-                    for line in cleaned_text.splitlines():
-                         self.log_message(f"[{miner_key.upper()}] {line}", color=log_color)
+                # Usually whole lines, so a multi-byte character is rarely split; "replace" covers the rest
+                cleaned_text = output_bytes.decode('utf-8', errors='replace').strip()
+                if cleaned_text:
+                    log_color = _MINER_LOG_COLORS.get(self.current_theme, "#00008B") # DarkBlue
+                    # The whole chunk becomes one buffer entry; every line keeps its own prefix
+                    prefix = f"[{time.strftime('%H:%M:%S')}] [{miner_key.upper()}] "
+                    self._log_buffer.append((prefix + ("\n" + prefix).join(cleaned_text.splitlines()), log_color))
             except Exception:
                  self.log_message(f"Kunde inte avkoda output från {miner_key}", error=True)
 
     def handle_miner_finished(self, miner_key: str, exitCode: int, exitStatus: QProcess.ExitStatus):
         status_desc = "kraschade" if exitStatus == QProcess.ExitStatus.CrashExit else "avslutades normalt"
         is_error = exitStatus == QProcess.ExitStatus.CrashExit or exitCode != 0
+        self.handle_miner_output(miner_key, final=True) # Log whatever the timer has not drained yet
         self.log_message(f"{miner_key.capitalize()} {status_desc} (Kod: {exitCode}).", error=is_error)
         self.miner_processes[miner_key] = None
         self._update_specific_manual_buttons(miner_key, is_running=False)
 
     def _update_specific_manual_buttons(self, miner_key: str, is_running: bool):
-         start_button = getattr(self, f"{miner_key}_start_button", None)
-         stop_button = getattr(self, f"{miner_key}_stop_button", None)
-         can_start = self.exec_status.get(miner_key, False)
-         if start_button: start_button.setEnabled(can_start and not is_running)
-         if stop_button: stop_button.setEnabled(is_running)
+         buttons = self.miner_buttons.get(miner_key)
+         if not buttons: return
+         buttons["start"].setEnabled(self.exec_status.get(miner_key, False) and not is_running)
+         buttons["stop"].setEnabled(is_running)
 
     # ======================================================================
     # === COMMAND BUILDERS (FULLY RESTORED) ===
     # ======================================================================
 
     def build_gminer_command(self) -> Optional[List[str]]:
-        try:
-            path = self.gminer_path_edit.text().strip()
-            if not path: return None
-            cmd = [path]
-            config_path = self.gminer_config_edit.text().strip()
-            if config_path: return ["--config", config_path]
-            pool_url = self._get_selected_pool("gminer")
-            if not pool_url: return None
-            cmd += ["-s", pool_url]
-            if self.gminer_algo_combo.currentText(): cmd += ["-a", self.gminer_algo_combo.currentText()]
-            if self.gminer_user_edit.text(): cmd += ["-u", self.gminer_user_edit.text()]
-            if self.gminer_pass_edit.text(): cmd += ["-p", self.gminer_pass_edit.text()]
-            if self.gminer_ssl_combo.currentText() == "on": cmd += ["--ssl", "1"]
-            if self.gminer_proto_combo.currentText() != "stratum": cmd += ["--proto", self.gminer_proto_combo.currentText()]
-            if self.gminer_proxy_edit.text(): cmd += ["--proxy", self.gminer_proxy_edit.text()]
-            if self.gminer_devices_edit.text(): cmd += ["-d", self.gminer_devices_edit.text()]
-            if self.gminer_intensity_edit.text(): cmd += ["-i", self.gminer_intensity_edit.text()]
-            if self.gminer_dual_intensity_edit.text(): cmd += ["-di", self.gminer_dual_intensity_edit.text()]
-            if self.gminer_fan_edit.text(): cmd += ["--fan", self.gminer_fan_edit.text()]
-            if self.gminer_pl_edit.text(): cmd += ["--pl", self.gminer_pl_edit.text()]
-            if self.gminer_cclock_edit.text(): cmd += ["--cclock", self.gminer_cclock_edit.text()]
-            if self.gminer_mclock_edit.text(): cmd += ["--mclock", self.gminer_mclock_edit.text()]
-            if self.gminer_lock_cclock_edit.text(): cmd += ["--lock_cclock", self.gminer_lock_cclock_edit.text()]
-            if self.gminer_lock_mclock_edit.text(): cmd += ["--lock_mclock", self.gminer_lock_mclock_edit.text()]
-            if self.gminer_mt_edit.text(): cmd += ["--mt", self.gminer_mt_edit.text()]
-            if self.gminer_logfile_edit.text(): cmd += ["-l", self.gminer_logfile_edit.text()]
-            if self.gminer_log_date_spin.value() == 1: cmd += ["--log_date", "1"]
-            if self.gminer_log_newjob_spin.value() == 0: cmd += ["--log_newjob", "0"]
-            if self.gminer_api_edit.text(): cmd += ["--api", self.gminer_api_edit.text()]
-            if not self.gminer_color_cb.isChecked(): cmd += ["-c", "0"]
-            if not self.gminer_watchdog_cb.isChecked(): cmd += ["-w", "0"]
-            return cmd
-        except Exception as e:
-             self.log_message(f"Fel vid byggande av GMiner-kommando: {e}", error=True)
-             return None
+        # Builders read the same signal-fed snapshot as _save_all, not the widgets
+        values = self._widget_values
+        path = values["gminer/path"].strip()
+        if not path: return None
+        cmd = [path]
+        config_path = values["gminer/config"].strip()
+        if config_path: return ["--config", config_path]
+        pool_url = self._get_selected_pool("gminer")
+        if not pool_url: return None
+        cmd.extend(("-s", pool_url))
+        cmd += self._cli_args("gminer")
+        return cmd
 
     def build_lolminer_command(self) -> Optional[List[str]]:
-        try:
-            path = self.lolminer_path_edit.text().strip()
-            if not path: return None
-            cmd = [path]
-            if self.lolminer_config_edit.text().strip() != "./lolMiner.cfg": cmd += ["--config", self.lolminer_config_edit.text().strip()]
-            if self.lolminer_json_edit.text().strip() != "./user_config.json": cmd += ["--json", self.lolminer_json_edit.text().strip()]
-            if self.lolminer_profile_edit.text().strip(): cmd += ["--profile", self.lolminer_profile_edit.text().strip()]
-            if self.lolminer_nocolor_cb.isChecked(): cmd.append("--nocolor")
-            if self.lolminer_basecolor_cb.isChecked(): cmd.append("--basecolor")
-            if self.lolminer_no_cl_cb.isChecked(): cmd.append("--no-cl")
-            if self.lolminer_version_cb.isChecked(): return cmd + ["-v"]
-            if not self.lolminer_profile_edit.text().strip():
-                if self.lolminer_algo_edit.text().strip(): cmd += ["--algo", self.lolminer_algo_edit.text().strip()]
-                pool_url = self._get_selected_pool("lolminer")
-                if not pool_url and not self.lolminer_benchmark_edit.text().strip(): return None
-                if pool_url: cmd += ["--pool", pool_url]
-                if self.lolminer_user_edit.text().strip(): cmd += ["--user", self.lolminer_user_edit.text().strip()]
-                if self.lolminer_pass_edit.text().strip(): cmd += ["--pass", self.lolminer_pass_edit.text().strip()]
-            if self.lolminer_benchmark_edit.text().strip(): cmd += ["--benchmark", self.lolminer_benchmark_edit.text().strip()]
-            if self.lolminer_tls_combo.currentText() == "on": cmd += ["--tls", "on"]
-            if self.lolminer_devices_edit.text().strip().upper() != "ALL": cmd += ["--devices", self.lolminer_devices_edit.text().strip()]
-            if self.lolminer_devicesbypcie_cb.isChecked(): cmd.append("--devicesbypcie")
-            if self.lolminer_socks5_edit.text().strip(): cmd += ["--socks5", self.lolminer_socks5_edit.text().strip()]
-            if self.lolminer_doh_spin.value() != 1: cmd += ["--dns-over-https", str(self.lolminer_doh_spin.value())]
-            if self.lolminer_watchdog_combo.currentText() != "script": cmd += ["--watchdog", self.lolminer_watchdog_combo.currentText()]
-            if self.lolminer_watchdogscript_edit.text().strip(): cmd += ["--watchdogscript", self.lolminer_watchdogscript_edit.text().strip()]
-            if self.lolminer_tstart_spin.value() != 0: cmd += ["--tstart", str(self.lolminer_tstart_spin.value())]
-            if self.lolminer_tstop_spin.value() != 0: cmd += ["--tstop", str(self.lolminer_tstop_spin.value())]
-            if self.lolminer_tmode_combo.currentText() != "edge": cmd += ["--tmode", self.lolminer_tmode_combo.currentText()]
-            if self.lolminer_apiport_spin.value() != 0: cmd += ["--apiport", str(self.lolminer_apiport_spin.value())]
-            if self.lolminer_apihost_edit.text().strip() != "0.0.0.0": cmd += ["--apihost", self.lolminer_apihost_edit.text().strip()]
-            if self.lolminer_longstats_spin.value() != 60: cmd += ["--longstats", str(self.lolminer_longstats_spin.value())]
-            if self.lolminer_shortstats_spin.value() != 15: cmd += ["--shortstats", str(self.lolminer_shortstats_spin.value())]
-            if self.lolminer_timeprint_cb.isChecked(): cmd.append("--timeprint")
-            if self.lolminer_compactaccept_cb.isChecked(): cmd.append("--compactaccept")
-            if self.lolminer_log_cb.isChecked(): cmd.append("--log")
-            if self.lolminer_logfile_edit.text().strip(): cmd += ["--logfile", self.lolminer_logfile_edit.text().strip()]
-            def add_oc(p, w):
-                if w.text().strip() and w.text().strip() != "*": cmd.extend([p, w.text().strip()])
-            add_oc("--cclk", self.lolminer_cclk_edit); add_oc("--mclk", self.lolminer_mclk_edit)
-            add_oc("--coff", self.lolminer_coff_edit); add_oc("--moff", self.lolminer_moff_edit)
-            add_oc("--fan", self.lolminer_fan_edit); add_oc("--pl", self.lolminer_pl_edit)
-            if self.lolminer_no_oc_reset_cb.isChecked(): cmd.append("--no-oc-reset")
-            if self.lolminer_ethstratum_combo.currentText() != "ETHPROXY": cmd += ["--ethstratum", self.lolminer_ethstratum_combo.currentText()]
-            if self.lolminer_lhrtune_edit.text().strip().lower() != "auto": cmd += ["--lhrtune", self.lolminer_lhrtune_edit.text().strip()]
-            if self.lolminer_dualmode_combo.currentText() != "none":
-                cmd += ["--dualmode", self.lolminer_dualmode_combo.currentText()]
-                if self.lolminer_dualpool_edit.text().strip(): cmd += ["--dualpool", self.lolminer_dualpool_edit.text().strip()]
-                if self.lolminer_dualuser_edit.text().strip(): cmd += ["--dualuser", self.lolminer_dualuser_edit.text().strip()]
-                if self.lolminer_dualpass_edit.text().strip(): cmd += ["--dualpass", self.lolminer_dualpass_edit.text().strip()]
+        values = self._widget_values
+        path = values["lolminer/path"].strip()
+        if not path: return None
+        cmd = [path]
+        config_path = values["lolminer/config"].strip()
+        if config_path != "./lolMiner.cfg": cmd.extend(("--config", config_path))
+        json_path = values["lolminer/json"].strip()
+        if json_path != "./user_config.json": cmd.extend(("--json", json_path))
+        profile = values["lolminer/profile"].strip()
+        if profile: cmd.extend(("--profile", profile))
+        if values["lolminer/nocolor"]: cmd.append("--nocolor")
+        if values["lolminer/basecolor"]: cmd.append("--basecolor")
+        if values["lolminer/no-cl"]: cmd.append("--no-cl")
+        if values["lolminer/version"]:
+            cmd.append("-v")
             return cmd
-        except Exception as e:
-             self.log_message(f"Fel vid byggande av lolMiner-kommando: {e}", error=True)
-             return None
+        benchmark = values["lolminer/benchmark"].strip()
+        if not profile:
+            algo = values["lolminer/algo"].strip()
+            if algo: cmd.extend(("--algo", algo))
+            pool_url = self._get_selected_pool("lolminer")
+            if not pool_url and not benchmark: return None
+            if pool_url: cmd.extend(("--pool", pool_url))
+            user = values["lolminer/user"].strip()
+            if user: cmd.extend(("--user", user))
+            password = values["lolminer/pass"].strip()
+            if password: cmd.extend(("--pass", password))
+        if benchmark: cmd.extend(("--benchmark", benchmark))
+        cmd += self._cli_args("lolminer")
+        dualmode = values["lolminer/dualmode"]
+        if dualmode != "none":
+            cmd.extend(("--dualmode", dualmode))
+            for flag, name in (("--dualpool", "lolminer/dualpool"), ("--dualuser", "lolminer/dualuser"),
+                               ("--dualpass", "lolminer/dualpass")):
+                value = values[name].strip()
+                if value: cmd.extend((flag, value))
+        return cmd
 
     def build_trex_command(self) -> Optional[List[str]]:
-        try:
-            path = self.trex_path_edit.text().strip()
-            if not path: return None
-            cmd = [path]
-            if self.trex_config_edit.text().strip(): return cmd + ["-c", self.trex_config_edit.text().strip()]
-            if self.trex_benchmark_cb.isChecked():
-                cmd.append("-B")
-                if self.trex_algo_combo.currentText(): cmd += ["-a", self.trex_algo_combo.currentText()]
-                return cmd
-            pool_url = self._get_selected_pool("trex")
-            if not pool_url: return None
-            cmd += ["-o", pool_url]
-            if self.trex_algo_combo.currentText(): cmd += ["-a", self.trex_algo_combo.currentText()]
-            if self.trex_coin_edit.text(): cmd += ["--coin", self.trex_coin_edit.text()]
-            if self.trex_user_edit.text(): cmd += ["-u", self.trex_user_edit.text()]
-            if self.trex_pass_edit.text(): cmd += ["-p", self.trex_pass_edit.text()]
-            if self.trex_worker_edit.text(): cmd += ["-w", self.trex_worker_edit.text()]
-            if self.trex_url2_edit.text(): cmd += ["--url2", self.trex_url2_edit.text()]
-            if self.trex_user2_edit.text(): cmd += ["--user2", self.trex_user2_edit.text()]
-            if self.trex_pass2_edit.text(): cmd += ["--pass2", self.trex_pass2_edit.text()]
-            if self.trex_worker2_edit.text(): cmd += ["--worker2", self.trex_worker2_edit.text()]
-            if self.trex_devices_edit.text(): cmd += ["-d", self.trex_devices_edit.text()]
-            if self.trex_intensity_edit.text(): cmd += ["-i", self.trex_intensity_edit.text()]
-            if self.trex_low_load_cb.isChecked(): cmd.append("--low-load")
-            if self.trex_fan_edit.text(): cmd += ["--fan", self.trex_fan_edit.text()]
-            if self.trex_pl_edit.text(): cmd += ["--pl", self.trex_pl_edit.text()]
-            if self.trex_cclock_edit.text(): cmd += ["--cclock", self.trex_cclock_edit.text()]
-            if self.trex_lock_cclock_edit.text(): cmd += ["--lock-cclock", self.trex_lock_cclock_edit.text()]
-            if self.trex_mclock_edit.text(): cmd += ["--mclock", self.trex_mclock_edit.text()]
-            if self.trex_lock_cv_edit.text(): cmd += ["--lock-cv", self.trex_lock_cv_edit.text()]
-            if self.trex_mt_edit.text(): cmd += ["--mt", self.trex_mt_edit.text()]
-            if self.trex_lhr_tune_edit.text() != "-1": cmd += ["--lhr-tune", self.trex_lhr_tune_edit.text()]
-            if self.trex_lhr_autotune_combo.currentText() != "down": cmd += ["--lhr-autotune-mode", self.trex_lhr_autotune_combo.currentText()]
-            if self.trex_api_bind_edit.text() != "127.0.0.1:4067": cmd += ["--api-bind-http", self.trex_api_bind_edit.text()]
-            if self.trex_api_https_cb.isChecked(): cmd.append("--api-https")
-            if self.trex_api_key_edit.text(): cmd += ["--api-key", self.trex_api_key_edit.text()]
-            if self.trex_api_read_only_cb.isChecked(): cmd.append("--api-read-only")
-            if self.trex_quiet_cb.isChecked(): cmd.append("-q")
-            if self.trex_no_color_cb.isChecked(): cmd.append("--no-color")
-            if self.trex_log_path_edit.text(): cmd += ["-l", self.trex_log_path_edit.text()]
-            if self.trex_protocol_dump_cb.isChecked(): cmd.append("-P")
-            if self.trex_no_watchdog_cb.isChecked(): cmd.append("--no-watchdog")
-            if self.trex_watchdog_exit_edit.text(): cmd += ["--watchdog-exit-mode", self.trex_watchdog_exit_edit.text()]
+        values = self._widget_values
+        path = values["trex/path"].strip()
+        if not path: return None
+        # A config file carries every other option, so nothing else is read
+        config_path = values["trex/config"].strip()
+        if config_path: return [path, "-c", config_path]
+        if values["trex/benchmark"]:
+            cmd = [path, "-B"]
+            algo = values["trex/algo"]
+            if algo: cmd.extend(("-a", algo))
             return cmd
-        except Exception as e:
-             self.log_message(f"Fel vid byggande av T-Rex-kommando: {e}", error=True)
-             return None
+        pool_url = self._get_selected_pool("trex")
+        if not pool_url: return None
+        cmd = [path, "-o", pool_url]
+        cmd += self._cli_args("trex")
+        return cmd
 
     def build_xmrig_command(self) -> Optional[List[str]]:
-        try:
-            path = self.xmrig_path_edit.text().strip()
-            if not path: return None
-            cmd = [path]
-            if self.xmrig_config_file_edit.text().strip(): return cmd + ["-c", self.xmrig_config_file_edit.text().strip()]
-            pool_url = self._get_selected_pool("xmrig")
-            if not pool_url: return None
-            cmd += ["-o", pool_url]
-            if self.xmrig_algo_edit.text(): cmd += ["-a", self.xmrig_algo_edit.text()]
-            if self.xmrig_coin_edit.text(): cmd += ["--coin", self.xmrig_coin_edit.text()]
-            if self.xmrig_userpass_edit.text(): cmd += ["-O", self.xmrig_userpass_edit.text()]
-            else:
-                if self.xmrig_user_edit.text(): cmd += ["-u", self.xmrig_user_edit.text()]
-                if self.xmrig_pass_edit.text(): cmd += ["-p", self.xmrig_pass_edit.text()]
-            if self.xmrig_proxy_edit.text(): cmd += ["-x", self.xmrig_proxy_edit.text()]
-            if self.xmrig_keepalive_cb.isChecked(): cmd.append("-k")
-            if self.xmrig_nicehash_cb.isChecked(): cmd.append("--nicehash")
-            if self.xmrig_rigid_edit.text(): cmd += ["--rig-id", self.xmrig_rigid_edit.text()]
-            if self.xmrig_tls_cb.isChecked(): cmd.append("--tls")
-            if self.xmrig_tls_fp_edit.text(): cmd += ["--tls-fingerprint", self.xmrig_tls_fp_edit.text()]
-            if self.xmrig_daemon_cb.isChecked(): cmd.append("--daemon")
-            if self.xmrig_dns_ipv6_cb.isChecked(): cmd.append("--dns-ipv6")
-            if self.xmrig_no_cpu_cb.isChecked(): cmd.append("--no-cpu")
-            else:
-                if self.xmrig_threads_edit.text(): cmd += ["-t", self.xmrig_threads_edit.text()]
-                if self.xmrig_cpu_affinity_edit.text(): cmd += ["--cpu-affinity", self.xmrig_cpu_affinity_edit.text()]
-                if self.xmrig_av_spin.value() != 0: cmd += ["-v", str(self.xmrig_av_spin.value())]
-                if self.xmrig_cpu_priority_spin.value() != 2: cmd += ["--cpu-priority", str(self.xmrig_cpu_priority_spin.value())]
-                if self.xmrig_no_huge_pages_cb.isChecked(): cmd.append("--no-huge-pages")
-                if self.xmrig_randomx_no_numa_cb.isChecked(): cmd.append("--randomx-no-numa")
-            if self.xmrig_http_port_spin.value() != 0: cmd += ["--http-port", str(self.xmrig_http_port_spin.value())]
-            if self.xmrig_http_access_token_edit.text(): cmd += ["--http-access-token", self.xmrig_http_access_token_edit.text()]
-            if self.xmrig_log_file_edit.text(): cmd += ["-l", self.xmrig_log_file_edit.text()]
-            if self.xmrig_verbose_cb.isChecked(): cmd.append("--verbose")
-            if self.xmrig_background_cb.isChecked(): cmd.append("-B")
-            return cmd
-        except Exception as e:
-             self.log_message(f"Fel vid byggande av XMRig-kommando: {e}", error=True)
-             return None
+        values = self._widget_values
+        path = values["xmrig/path"].strip()
+        if not path: return None
+        # A config file carries every other option, so nothing else is read
+        config_path = values["xmrig/config"].strip()
+        if config_path: return [path, "-c", config_path]
+        pool_url = self._get_selected_pool("xmrig")
+        if not pool_url: return None
+        cmd = [path, "-o", pool_url]
+        cmd += self._cli_args("xmrig")
+        return cmd
 
     # ======================================================================
     # === EVENT HANDLING & UTILITIES ===
     # ======================================================================
 
     def closeEvent(self, event):
-        self.log_message("Avslutar Miner Controller...")
-        self.save_settings()
-        self.stop_polling()
-        for miner_key in list(self.miner_processes.keys()):
-             process = self.miner_processes.get(miner_key)
-             if process and process.state() != QProcess.ProcessState.NotRunning:
-                  self.log_message(f"Försöker stoppa {miner_key.capitalize()} vid avslut...")
-                  self.stop_miner_process(miner_key, manual_stop=True)
-                  process.waitForFinished(1000)
+        if self._closing is None:
+            self.log_message("Avslutar Miner Controller...")
+            self._save_timer.stop()
+            self.save_settings()
+            self._settings_writer.stop()
+            self.stop_polling()
+            # SIGTERM every miner; the window closes for real once they have all exited
+            self._closing = set()
+            not_running = QProcess.ProcessState.NotRunning
+            log, stop = self.log_message, self.stop_miner_process
+            for miner_key, process in tuple(self.miner_processes.items()):
+                 if process and process.state() != not_running:
+                      # stop_polling above may already have stopped the price-controlled miner
+                      if not process.property("stopping"):
+                           log(f"Försöker stoppa {miner_key.capitalize()} vid avslut...")
+                           stop(miner_key, manual_stop=True)
+                      self._closing.add(process)
+                      process.finished.connect(functools.partial(self._on_closing_miner_finished, process))
+            if self._closing:
+                # The event loop keeps running meanwhile, so the window stays drawn instead of freezing
+                self.setEnabled(False)
+                QTimer.singleShot(MINER_CLOSE_GRACE_MS, self._kill_closing_miners)
+        if self._closing:
+            event.ignore()
+            return
+        # Lines logged since the last flush would only be laid out into a window that is going away
+        self._log_flush_timer.stop()
+        self._log_buffer.clear()
+        self.http.close()
         event.accept()
 
+    def _on_closing_miner_finished(self, process: QProcess, *_):
+        if process in self._closing:
+            self._closing.discard(process)
+            if not self._closing:
+                self.close()
+
+    def _kill_closing_miners(self):
+        # The per-miner kill timers are longer than this and would never fire once the window is gone
+        self._closing = set()
+        self._reap_miners()
+        self.close()
+
+    def _reap_miners(self):
+        """Kills every miner still running and waits for it, e.g. when quitting without a close."""
+        for process in tuple(self.miner_processes.values()):
+            if process and process.state() != QProcess.ProcessState.NotRunning:
+                process.kill()
+                # Left running, it would report finished from its destructor into a half-destroyed window
+                process.waitForFinished(100)
+
 # --- Main Execution ---
 if __name__ == "__main__":
     QApplication.setOrganizationName("MinerHub")
@@ -0,0 +1,200 @@
+import os
+import time
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+import pytest
+from PyQt5.QtCore import QEvent, QProcess, QSettings, QThreadPool
+from PyQt5.QtWidgets import QApplication
+
+import multi_miner
+
+app = QApplication.instance() or QApplication([])
+
+
+@pytest.fixture
+def settings_dir(tmp_path):
+    QApplication.setOrganizationName("MinerHubTest")
+    QApplication.setApplicationName("Unified-Miner-Controller")
+    QSettings.setPath(QSettings.Format.NativeFormat, QSettings.Scope.UserScope, str(tmp_path))
+    return tmp_path
+
+
+@pytest.fixture
+def make_hub(settings_dir, monkeypatch):
+    monkeypatch.setattr(multi_miner.MinerHubGUI, "fetch_and_display_initial_price", lambda self: None)
+    hubs = []
+
+    def make():
+        hub = multi_miner.MinerHubGUI()
+        hubs.append(hub)
+        return hub
+
+    yield make
+    for hub in hubs:
+        hub.close()
+    # Background checks report back through queued signals; deliver them while the windows exist
+    QThreadPool.globalInstance().waitForDone()
+    app.processEvents()
+    # Delete the windows now rather than whenever the cyclic GC gets to them, which may be
+    # in the middle of a later test's event processing
+    for hub in hubs:
+        hub.deleteLater()
+    QApplication.sendPostedEvents(None, QEvent.Type.DeferredDelete)
+
+
+def test_built_tab_page_repaints(make_hub):
+    hub = make_hub()
+    hub.miner_tabs.setCurrentIndex(hub._tab_keys.index("xmrig"))
+    app.processEvents()
+    assert hub._tab_pages["XMRig"].updatesEnabled()
+
+
+def _write_ini(settings_dir, text):
+    path = settings_dir / "MinerHubTest" / "Unified-Miner-Controller.conf"
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(text)
+
+
+def test_float_formatted_int_setting_loads(settings_dir, make_hub):
+    _write_ini(settings_dir, "[polling]\ninterval=120.0\n")
+    hub = make_hub()
+    assert hub.poll_interval_spin.value() == 120
+
+
+@pytest.mark.parametrize("stored", ["abc", ""])
+def test_unreadable_int_setting_falls_back_to_default(settings_dir, make_hub, stored):
+    _write_ini(settings_dir, f"[polling]\ninterval={stored}\n")
+    hub = make_hub()
+    assert hub.poll_interval_spin.value() == 300
+    hub.close()
+    assert str(QSettings().value("polling/interval")) == "300"
+
+
+@pytest.fixture
+def fake_miner(tmp_path):
+    """Executable that runs until it is signalled; trap_term makes it ignore SIGTERM."""
+    def make(trap_term=False):
+        script = tmp_path / ("stubborn.sh" if trap_term else "miner.sh")
+        trap = "trap '' TERM\n" if trap_term else ""
+        script.write_text(f"#!/bin/sh\n{trap}while :; do sleep 0.1; done\n")
+        script.chmod(0o755)
+        return str(script)
+    return make
+
+
+def _wait_until(condition, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while not condition() and time.monotonic() < deadline:
+        app.processEvents()
+        time.sleep(0.01)
+    return condition()
+
+
+def _xmrig_hub(make_hub, executable):
+    hub = make_hub()
+    hub.miner_tabs.setCurrentIndex(hub._tab_keys.index("xmrig"))
+    app.processEvents()
+    hub.xmrig_path_edit.setText(executable)
+    return hub
+
+
+def _reap(hub):
+    for process in hub.miner_processes.values():
+        if process is not None:
+            process.kill()
+            process.waitForFinished(1000)
+    app.processEvents()
+
+
+def test_restarting_price_control_is_not_held_by_dwell(make_hub, fake_miner, monkeypatch):
+    hub = _xmrig_hub(make_hub, fake_miner())
+    hub.start_mining_spin.setValue(0.5)
+    monkeypatch.setattr(hub, "_request_prices", lambda url, handler: handler([]))
+    monkeypatch.setattr(hub, "get_current_price_from_api", lambda prices: 0.4)
+    try:
+        hub.start_polling()
+        assert hub._miner_running("xmrig")
+        hub.stop_polling()
+        assert _wait_until(lambda: hub.miner_processes["xmrig"] is None)
+        hub.start_polling()
+        assert hub._miner_running("xmrig")
+    finally:
+        hub.stop_polling()
+        _reap(hub)
+
+
+def test_buttons_stay_disabled_while_a_stopped_miner_exits(make_hub, fake_miner):
+    hub = _xmrig_hub(make_hub, fake_miner(trap_term=True))
+    buttons = hub.miner_buttons["xmrig"]
+    # The startup check ran against the default path; treat the fake miner as found
+    assert _wait_until(lambda: hub.exec_status)
+    hub.exec_status["xmrig"] = True
+    try:
+        hub.start_miner_manual("xmrig")
+        assert buttons["stop"].isEnabled()
+        buttons["stop"].click()
+        process = hub.miner_processes["xmrig"]
+        assert process.state() != QProcess.ProcessState.NotRunning
+        assert not buttons["start"].isEnabled()
+        assert not buttons["stop"].isEnabled()
+        process.kill()
+        assert _wait_until(lambda: hub.miner_processes["xmrig"] is None)
+        assert buttons["start"].isEnabled()
+        assert not buttons["stop"].isEnabled()
+    finally:
+        _reap(hub)
+
+
+class _FakeOutput:
+    """Stands in for a miner's QProcess holding one drain tick's worth of output."""
+
+    def __init__(self, chunk):
+        self.chunk = chunk
+
+    def bytesAvailable(self):
+        return len(self.chunk)
+
+    def readAllStandardOutput(self):
+        return self.chunk
+
+
+def _miner_log_lines(hub):
+    return [line for text, _ in hub._log_buffer for line in text.splitlines() if "[XMRIG]" in line]
+
+
+def _drain(hub, *chunks):
+    try:
+        for chunk in chunks:
+            hub.miner_processes["xmrig"] = _FakeOutput(chunk)
+            hub.handle_miner_output("xmrig")
+    finally:
+        hub.miner_processes["xmrig"] = None
+
+
+def test_carriage_return_status_lines_are_logged(make_hub):
+    hub = make_hub()
+    _drain(hub, b"progress 1%\rprogress 2%\r")
+    assert [line.split("] ")[-1] for line in _miner_log_lines(hub)] == ["progress 1%", "progress 2%"]
+    assert not hub._miner_partial["xmrig"]
+
+
+def test_unterminated_output_waits_at_most_one_tick(make_hub):
+    hub = make_hub()
+    _drain(hub, b"no newline yet")
+    assert not _miner_log_lines(hub)
+    _drain(hub, b"")
+    assert _miner_log_lines(hub)[-1].endswith("no newline yet")
+    assert not hub._miner_partial["xmrig"]
+
+
+def test_unterminated_output_is_capped(make_hub):
+    hub = make_hub()
+    _drain(hub, b"x" * (multi_miner.MINER_PENDING_MAX_BYTES + 1))
+    assert not hub._miner_partial["xmrig"]
+
+
+def test_flushing_a_partial_line_keeps_a_split_escape_code_whole(make_hub):
+    hub = make_hub()
+    _drain(hub, b"half \x1b[3", b"", b"1mdone\n")
+    assert [line.split("] ")[-1] for line in _miner_log_lines(hub)] == ["half", "done"]